@@ -28,15 +28,41 @@ class ValidationError(InputKitError):
         message: A description of the validation failure.
         field: (Optional) The input field or parameter involved.
         value: (Optional) The invalid value, if applicable.
+        template: (Optional) str.format template used instead of message;
+            formatted only when the error is converted to a string.
+        template_args: (Optional) Positional arguments for template.
         **context: Additional context for debugging.
     """
-    def __init__(self, message=None, field=None, value=None, **context):
-        if message is None:
+    def __init__(self, message=None, field=None, value=None, template=None, template_args=(), **context):
+        if message is None and template is None:
             message = "Validation failed."
         self.field = field
         self.value = value
         self.context = context
-        super().__init__(message)
+        self._template = template
+        self._template_args = template_args
+        if message is None:
+            super().__init__()
+        else:
+            super().__init__(message)
+
+    def __str__(self):
+        if self._template is not None and not self.args:
+            return self._template.format(*self._template_args)
+        return super().__str__()
+
+    def __repr__(self):
+        if self._template is not None and not self.args:
+            return f"{type(self).__name__}({str(self)!r})"
+        return super().__repr__()
+
+    def __reduce__(self):
+        # A templated error has empty args; pickle the rendered message so the
+        # copy reads the same without re-running the template.
+        if self._template is not None and not self.args:
+            state = dict(self.__dict__, _template=None, _template_args=())
+            return (type(self), (str(self),), state)
+        return super().__reduce__()
 
 
 class ValidatorConfigurationError(ValidationError):
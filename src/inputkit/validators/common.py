@@ -21,7 +21,7 @@ import re
 from typing import Any, Optional, Pattern
 
 from .core import BaseValidator
-from .patterns import BooleanPattern
+from .patterns import BooleanPattern, compile_pattern
 from ..exceptions import RequiredValueError, ValidationError
 
 
@@ -137,6 +137,7 @@ class BooleanValidator(BaseValidator):
         """
         super().__init__(custom_pattern=custom_pattern, field_name=field_name)
         self.pattern = BooleanPattern.PATTERN
+        self._bind_pattern(self.pattern, f"Invalid boolean/confirmation format for {self._field_label}")
     
     def validate(self, value: Any) -> bool:
         """
@@ -160,13 +161,11 @@ class BooleanValidator(BaseValidator):
         else:
             value = value.lower().strip()
         
-        pattern = self.custom_pattern or self.pattern
-        self._match_pattern(
-            value,
-            pattern,
-            error_message=f"Invalid boolean/confirmation format for {self.field_name or 'field'}"
-        )
-        return True
+        # Default tokens are a fixed set: one hash lookup instead of a regex run
+        if self.custom_pattern is None and value in BooleanPattern.VALUES:
+            return True
+        
+        return self._match_active(value)
 
 
 class YesNoValidator(BaseValidator):
@@ -184,7 +183,8 @@ class YesNoValidator(BaseValidator):
             field_name: Optional field name for error messages.
         """
         super().__init__(field_name=field_name)
-        self.pattern = re.compile(r"^(?i)(y(es)?|no?)$")
+        self.pattern = compile_pattern(r"^(y(es)?|no?)$", re.IGNORECASE | re.ASCII)
+        self._bind_pattern(self.pattern, f"Must be 'yes' or 'no' for {self._field_label}")
     
     def validate(self, value: Any) -> bool:
         """
@@ -202,12 +202,7 @@ class YesNoValidator(BaseValidator):
         if not isinstance(value, str):
             value = str(value)
         
-        self._match_pattern(
-            value,
-            self.pattern,
-            error_message=f"Must be 'yes' or 'no' for {self.field_name or 'field'}"
-        )
-        return True
+        return self._match_active(value)
 
 
 class TrueFalseValidator(BaseValidator):
@@ -225,7 +220,8 @@ class TrueFalseValidator(BaseValidator):
             field_name: Optional field name for error messages.
         """
         super().__init__(field_name=field_name)
-        self.pattern = re.compile(r"^(?i)(true|false|t|f|1|0)$")
+        self.pattern = compile_pattern(r"^(true|false|t|f|1|0)$", re.IGNORECASE | re.ASCII)
+        self._bind_pattern(self.pattern, f"Must be 'true' or 'false' for {self._field_label}")
     
     def validate(self, value: Any) -> bool:
         """
@@ -246,12 +242,7 @@ class TrueFalseValidator(BaseValidator):
         if not isinstance(value, str):
             value = str(value)
         
-        self._match_pattern(
-            value,
-            self.pattern,
-            error_message=f"Must be 'true' or 'false' for {self.field_name or 'field'}"
-        )
-        return True
+        return self._match_active(value)
 
 
 class ContinueConfirmationValidator(BaseValidator):
@@ -269,7 +260,8 @@ class ContinueConfirmationValidator(BaseValidator):
             field_name: Optional field name for error messages.
         """
         super().__init__(field_name=field_name)
-        self.pattern = re.compile(r"^(?i)(continue|proceed|yes|y|ok|sure|confirm|go)$")
+        self.pattern = compile_pattern(r"^(continue|proceed|yes|y|ok|sure|confirm|go)$", re.IGNORECASE | re.ASCII)
+        self._bind_pattern(self.pattern, f"Invalid confirmation for {self._field_label}")
     
     def validate(self, value: Any) -> bool:
         """
@@ -287,12 +279,7 @@ class ContinueConfirmationValidator(BaseValidator):
         if not isinstance(value, str):
             value = str(value)
         
-        self._match_pattern(
-            value,
-            self.pattern,
-            error_message=f"Invalid confirmation for {self.field_name or 'field'}"
-        )
-        return True
+        return self._match_active(value)
 
 
 class AgreementValidator(BaseValidator):
@@ -310,7 +297,8 @@ class AgreementValidator(BaseValidator):
             field_name: Optional field name for error messages.
         """
         super().__init__(field_name=field_name)
-        self.pattern = re.compile(r"^(?i)(agree|accept|yes|y|consent|acknowledge|ack)$")
+        self.pattern = compile_pattern(r"^(agree|accept|yes|y|consent|acknowledge|ack)$", re.IGNORECASE | re.ASCII)
+        self._bind_pattern(self.pattern, f"Agreement required for {self._field_label}")
     
     def validate(self, value: Any) -> bool:
         """
@@ -328,9 +316,4 @@ class AgreementValidator(BaseValidator):
         if not isinstance(value, str):
             value = str(value)
         
-        self._match_pattern(
-            value,
-            self.pattern,
-            error_message=f"Agreement required for {self.field_name or 'field'}"
-        )
-        return True
+        return self._match_active(value)
@@ -20,18 +20,68 @@ Purpose:
 - Enable flexible validation of composite inputs.
 """
 
-import re
-from typing import Optional, Pattern, Any, List, Dict, Union, Set
+from typing import Optional, Pattern, Any, List, Dict, Union, Set, Iterable
 from enum import Enum
 from datetime import datetime, date
 
 from .core import BaseValidator
 from .strings import UsernameValidator, EmailValidator
 from .security import PasswordValidator
-from .patterns import MobileNumberPattern
+from .patterns import MobileNumberPattern, compile_pattern
 from ..exceptions import ValidationError, RequiredValueError, PatternMismatchError
 
 
+class _ChoiceList:
+    """Renders choices as a comma-separated list, only when an error message is formatted."""
+    
+    __slots__ = ("choices",)
+    
+    def __init__(self, choices: Iterable[Any]):
+        # Snapshot, so later changes to the validator's list don't alter the message
+        self.choices = tuple(choices)
+    
+    def __format__(self, spec: str) -> str:
+        return format(", ".join(map(str, self.choices)), spec)
+
+
+class _EnumNames:
+    """Renders the member names of an enum, only when an error message is formatted."""
+    
+    __slots__ = ("enum_class",)
+    
+    def __init__(self, enum_class: type):
+        self.enum_class = enum_class
+    
+    def __format__(self, spec: str) -> str:
+        return format(str([e.name for e in self.enum_class]), spec)
+
+
+_ISO_DATE_FORMAT = "%Y-%m-%d"
+
+
+def _parse_date(text: Any, date_format: str) -> date:
+    """
+    Parse a date string with ``datetime.strptime`` semantics.
+    
+    Canonical ``YYYY-MM-DD`` input under the default format is parsed with
+    ``date.fromisoformat``, which is far cheaper than ``strptime``; anything
+    else (other formats, unpadded fields, non-ASCII digits) uses ``strptime``.
+    """
+    if (
+        date_format == _ISO_DATE_FORMAT
+        and type(text) is str
+        and len(text) == 10
+        and text.isascii()
+        and text[4] == '-'
+        and text[7] == '-'
+    ):
+        try:
+            return date.fromisoformat(text)
+        except ValueError:
+            pass
+    return datetime.strptime(text, date_format).date()
+
+
 class CredentialsValidator(BaseValidator):
     """
     Validator for credentials (username + password combination).
@@ -71,10 +121,7 @@ class CredentialsValidator(BaseValidator):
             ValidationError: If validation fails.
         """
         if not isinstance(value, dict):
-            self._raise_validation_error(
-                f"Expected dict with 'username' and 'password', got {type(value).__name__}",
-                value=value
-            )
+            self._raise_wrong_type("dict with 'username' and 'password'", value)
         
         if 'username' not in value:
             raise RequiredValueError(field="username")
@@ -121,9 +168,18 @@ class AddressValidator(BaseValidator):
         self.require_country = require_country
         self.require_city = require_city
         self.require_postal_code = require_postal_code
-        self.country_pattern = country_pattern or re.compile(r"^[A-Za-z\s]{2,50}$")
-        self.city_pattern = city_pattern or re.compile(r"^[A-Za-z\s-']{2,50}$")
-        self.postal_code_pattern = postal_code_pattern or re.compile(r"^[A-Za-z0-9\s-]{3,10}$")
+        self.country_pattern = self._resolve_pattern(country_pattern, r"^[A-Za-z\s]{2,50}$")
+        self.city_pattern = self._resolve_pattern(city_pattern, r"^[A-Za-z\s'-]{2,50}$")
+        self.postal_code_pattern = self._resolve_pattern(postal_code_pattern, r"^[A-Za-z0-9\s-]{3,10}$")
+    
+    @staticmethod
+    def _resolve_pattern(pattern: Optional[Union[str, Pattern]], default: str) -> Pattern:
+        """Return a compiled pattern, compiling strings and the default through the shared cache."""
+        if pattern is None:
+            return compile_pattern(default)
+        if isinstance(pattern, str):
+            return compile_pattern(pattern)
+        return pattern
     
     def validate(self, value: Any) -> bool:
         """
@@ -139,10 +195,7 @@ class AddressValidator(BaseValidator):
             ValidationError: If validation fails.
         """
         if not isinstance(value, dict):
-            self._raise_validation_error(
-                f"Expected dict with address fields, got {type(value).__name__}",
-                value=value
-            )
+            self._raise_wrong_type("dict with address fields", value)
         
         if self.require_country:
             if 'country' not in value or not value['country']:
@@ -210,7 +263,8 @@ class PhoneNumberValidator(BaseValidator):
         else:
             if not MobileNumberPattern.is_valid(value, country=self.country):
                 self._raise_validation_error(
-                    f"Invalid phone number format for {self.field_name or 'field'}",
+                    template="Invalid phone number format for {}",
+                    template_args=(self._field_label,),
                     value=value
                 )
         
@@ -256,10 +310,7 @@ class DateRangeValidator(BaseValidator):
             ValidationError: If validation fails.
         """
         if not isinstance(value, dict):
-            self._raise_validation_error(
-                f"Expected dict with 'start_date' and 'end_date', got {type(value).__name__}",
-                value=value
-            )
+            self._raise_wrong_type("dict with 'start_date' and 'end_date'", value)
         
         if 'start_date' not in value:
             raise RequiredValueError(field="start_date")
@@ -268,11 +319,12 @@ class DateRangeValidator(BaseValidator):
             raise RequiredValueError(field="end_date")
         
         try:
-            start = datetime.strptime(value['start_date'], self.date_format).date()
-            end = datetime.strptime(value['end_date'], self.date_format).date()
+            start = _parse_date(value['start_date'], self.date_format)
+            end = _parse_date(value['end_date'], self.date_format)
         except ValueError as e:
             self._raise_validation_error(
-                f"Invalid date format. Expected {self.date_format}",
+                template="Invalid date format. Expected {}",
+                template_args=(self.date_format,),
                 value=value
             )
         
@@ -335,7 +387,8 @@ class SingleChoiceValidator(BaseValidator):
         if self.case_sensitive:
             if value not in self.choices:
                 self._raise_validation_error(
-                    f"Value must be one of: {', '.join(map(str, self.choices))}",
+                    template="Value must be one of: {}",
+                    template_args=(_ChoiceList(self.choices),),
                     value=value
                 )
         else:
@@ -343,17 +396,64 @@ class SingleChoiceValidator(BaseValidator):
                 choices_lower = [str(c).lower() for c in self.choices]
                 if value.lower() not in choices_lower:
                     self._raise_validation_error(
-                        f"Value must be one of: {', '.join(map(str, self.choices))}",
+                        template="Value must be one of: {}",
+                        template_args=(_ChoiceList(self.choices),),
                         value=value
                     )
             else:
                 if value not in self.choices:
                     self._raise_validation_error(
-                        f"Value must be one of: {', '.join(map(str, self.choices))}",
+                        template="Value must be one of: {}",
+                        template_args=(_ChoiceList(self.choices),),
                         value=value
                     )
         
         return True
+    
+    def validate_many(self, values: Iterable[Any]) -> List[Union[bool, ValidationError]]:
+        """
+        Validate many selections against a lookup set built once per call.
+        
+        Values found in the set pass without going through validate();
+        everything else (misses, unhashable values) falls back to validate()
+        so errors are identical to the single-value path.
+        
+        Args:
+            values: Iterable of selected values.
+            
+        Returns:
+            List with True or the ValidationError for each value.
+        """
+        lowered = not self.case_sensitive
+        try:
+            if lowered:
+                lookup = frozenset(str(c).lower() for c in self.choices)
+            else:
+                lookup = frozenset(self.choices)
+        except TypeError:
+            # Unhashable choices: no set lookup possible
+            return super().validate_many(values)
+        
+        results: List[Union[bool, ValidationError]] = []
+        append = results.append
+        validate = self.validate
+        for value in values:
+            if lowered:
+                hit = isinstance(value, str) and value.lower() in lookup
+            else:
+                try:
+                    hit = value in lookup
+                except TypeError:
+                    hit = False
+            if hit:
+                append(True)
+                continue
+            try:
+                validate(value)
+                append(True)
+            except ValidationError as e:
+                append(e)
+        return results
 
 
 class MultipleChoiceValidator(BaseValidator):
@@ -400,31 +500,35 @@ class MultipleChoiceValidator(BaseValidator):
         Raises:
             ValidationError: If validation fails.
         """
-        if not isinstance(value, (list, tuple, set)):
-            self._raise_validation_error(
-                f"Expected list/tuple/set, got {type(value).__name__}",
-                value=value
-            )
+        # Exact type checks first; isinstance only runs for subclasses/invalid input
+        value_type = type(value)
+        if value_type is not list and value_type is not tuple and value_type is not set:
+            if not isinstance(value, (list, tuple, set)):
+                self._raise_wrong_type("list/tuple/set", value)
         
-        selections = list(value)
+        # list/tuple/set all support len() and iteration; no copy needed
+        count = len(value)
         
-        if len(selections) < self.min_selections:
+        if count < self.min_selections:
             self._raise_validation_error(
-                f"At least {self.min_selections} selection(s) required",
+                template="At least {} selection(s) required",
+                template_args=(self.min_selections,),
                 value=value
             )
         
-        if self.max_selections and len(selections) > self.max_selections:
+        if self.max_selections and count > self.max_selections:
             self._raise_validation_error(
-                f"At most {self.max_selections} selection(s) allowed",
+                template="At most {} selection(s) allowed",
+                template_args=(self.max_selections,),
                 value=value
             )
         
-        for selection in selections:
+        for selection in value:
             if self.case_sensitive:
                 if selection not in self.choices:
                     self._raise_validation_error(
-                        f"Invalid choice: {selection}. Must be one of: {', '.join(map(str, self.choices))}",
+                        template="Invalid choice: {}. Must be one of: {}",
+                        template_args=(selection, _ChoiceList(self.choices)),
                         value=value
                     )
             else:
@@ -432,13 +536,15 @@ class MultipleChoiceValidator(BaseValidator):
                     choices_lower = [str(c).lower() for c in self.choices]
                     if selection.lower() not in choices_lower:
                         self._raise_validation_error(
-                            f"Invalid choice: {selection}. Must be one of: {', '.join(map(str, self.choices))}",
+                            template="Invalid choice: {}. Must be one of: {}",
+                            template_args=(selection, _ChoiceList(self.choices)),
                             value=value
                         )
                 else:
                     if selection not in self.choices:
                         self._raise_validation_error(
-                            f"Invalid choice: {selection}. Must be one of: {', '.join(map(str, self.choices))}",
+                            template="Invalid choice: {}. Must be one of: {}",
+                            template_args=(selection, _ChoiceList(self.choices)),
                             value=value
                         )
         
@@ -486,18 +592,45 @@ class IndexedListValidator(BaseValidator):
         try:
             index = int(value)
         except (ValueError, TypeError):
-            self._raise_validation_error(
-                f"Expected integer index, got {type(value).__name__}",
-                value=value
-            )
+            self._raise_wrong_type("integer index", value)
         
         if index < self.min_index or index >= self.max_index:
             self._raise_validation_error(
-                f"Index must be between {self.min_index} and {self.max_index - 1}",
+                template="Index must be between {} and {}",
+                template_args=(self.min_index, self.max_index - 1),
                 value=value
             )
         
         return True
+    
+    def validate_many(self, values: Iterable[Any]) -> List[Union[bool, ValidationError]]:
+        """
+        Validate many indices with an inlined range check.
+        
+        Args:
+            values: Iterable of index values (int or string representation).
+            
+        Returns:
+            List with True or the ValidationError for each value.
+        """
+        results: List[Union[bool, ValidationError]] = []
+        append = results.append
+        min_index = self.min_index
+        max_index = self.max_index
+        for value in values:
+            try:
+                index = int(value)
+            except (ValueError, TypeError):
+                index = None
+            if index is not None and min_index <= index < max_index:
+                append(True)
+                continue
+            try:
+                self.validate(value)
+                append(True)
+            except ValidationError as e:
+                append(e)
+        return results
 
 
 class EnumValidator(BaseValidator):
@@ -557,7 +690,8 @@ class EnumValidator(BaseValidator):
             pass
         
         self._raise_validation_error(
-            f"Value must be one of {[e.name for e in self.enum_class]}: {value}",
+            template="Value must be one of {}: {}",
+            template_args=(_EnumNames(self.enum_class), value),
             value=value
         )
 
@@ -601,10 +735,7 @@ class MultiFieldFormValidator(BaseValidator):
             ValidationError: If validation fails.
         """
         if not isinstance(value, dict):
-            self._raise_validation_error(
-                f"Expected dict with form fields, got {type(value).__name__}",
-                value=value
-            )
+            self._raise_wrong_type("dict with form fields", value)
         
         errors = []
         
@@ -13,12 +13,17 @@ Purpose:
 """
 
 import re
-from typing import Optional, Pattern, Callable, Any, List
+from typing import Optional, Pattern, Callable, Any, List, Iterable, Union, NoReturn
 from abc import ABC, abstractmethod
 
+from .patterns import compile_pattern
 from ..exceptions import ValidationError, PatternMismatchError
 
 
+# Shared template for the "wrong input type" error raised by most validators
+_WRONG_TYPE_TEMPLATE = "Expected {}, got {}"
+
+
 class BaseValidator(ABC):
     """
     Abstract base class for all validators in inputkit.
@@ -29,18 +34,28 @@ class BaseValidator(ABC):
     Attributes:
         custom_pattern: Optional custom regex pattern provided by the user.
         field_name: Optional field name for better error messages.
+    
+    Subclasses declare their own ``__slots__`` so instances carry no
+    per-instance ``__dict__``.
     """
     
-    def __init__(self, custom_pattern: Optional[Pattern] = None, field_name: Optional[str] = None):
+    __slots__ = ("custom_pattern", "field_name", "_field_label", "_active_pattern", "_fullmatch", "_active_error")
+    
+    def __init__(self, custom_pattern: Optional[Union[str, Pattern]] = None, field_name: Optional[str] = None):
         """
         Initialize the base validator.
         
         Args:
             custom_pattern: Optional custom regex pattern to use instead of default.
+                Pattern strings are compiled once and shared between validators.
             field_name: Optional name of the field being validated (for error messages).
         """
+        if isinstance(custom_pattern, str):
+            custom_pattern = compile_pattern(custom_pattern)
         self.custom_pattern = custom_pattern
         self.field_name = field_name
+        # Resolved once; error messages interpolate this instead of re-evaluating
+        self._field_label = field_name or 'field'
     
     @abstractmethod
     def validate(self, value: Any) -> bool:
@@ -58,10 +73,38 @@ class BaseValidator(ABC):
         """
         pass
     
-    def _raise_validation_error(self, message: str, value: Any = None, **context) -> None:
+    def validate_many(self, values: Iterable[Any]) -> List[Union[bool, ValidationError]]:
+        """
+        Validate many values in one call.
+        
+        Loops internally so bulk callers pay the method lookups once instead of
+        once per value. Failures are collected rather than raised.
+        
+        Args:
+            values: Iterable of values to validate.
+            
+        Returns:
+            List with one entry per value: True if it passed, or the
+            ValidationError it raised.
+        """
+        results: List[Union[bool, ValidationError]] = []
+        append = results.append
+        validate = self.validate
+        for value in values:
+            try:
+                validate(value)
+                append(True)
+            except ValidationError as e:
+                append(e)
+        return results
+    
+    def _raise_validation_error(self, message: Optional[str] = None, value: Any = None, **context) -> NoReturn:
         """
         Raise a validation error with proper context.
         
+        Pass ``template``/``template_args`` in context instead of message to
+        defer formatting until the error is actually displayed.
+        
         Args:
             message: Error message.
             value: The invalid value.
@@ -69,6 +112,56 @@ class BaseValidator(ABC):
         """
         raise ValidationError(message=message, field=self.field_name, value=value, **context)
     
+    def _raise_wrong_type(self, expected: str, value: Any) -> NoReturn:
+        """
+        Raise the standard "Expected <type>, got <type>" validation error.
+        
+        Args:
+            expected: Description of the accepted type(s), e.g. "string".
+            value: The value of the wrong type.
+        """
+        raise ValidationError(
+            template=_WRONG_TYPE_TEMPLATE,
+            template_args=(expected, type(value).__name__),
+            field=self.field_name,
+            value=value
+        )
+    
+    def _bind_pattern(self, default: Pattern, error_message: Optional[str] = None) -> None:
+        """
+        Resolve the pattern and error message used by _match_active once, at construction.
+        
+        Args:
+            default: The validator's built-in pattern; custom_pattern wins over it.
+            error_message: Optional mismatch message, formatted here rather than per call.
+        """
+        self._active_pattern = self.custom_pattern or default
+        self._fullmatch = self._active_pattern.fullmatch
+        self._active_error = error_message
+    
+    def _match_active(self, value: Any) -> bool:
+        """
+        Match a value against the pattern resolved by _bind_pattern.
+        
+        Shared validate() body for validators whose only rule is a pattern
+        match; the pattern and its bound fullmatch are not looked up per call.
+        
+        Args:
+            value: The value to match.
+            
+        Returns:
+            True if pattern matches.
+            
+        Raises:
+            PatternMismatchError: If pattern doesn't match.
+        """
+        if value.__class__ is not str and not isinstance(value, str):
+            self._raise_wrong_type("string", value)
+        
+        if self._fullmatch(value) is None:
+            self._match_pattern(value, self._active_pattern, error_message=self._active_error)
+        return True
+    
     def _match_pattern(self, value: str, pattern: Pattern, error_message: Optional[str] = None) -> bool:
         """
         Match a value against a regex pattern.
@@ -84,16 +177,14 @@ class BaseValidator(ABC):
         Raises:
             PatternMismatchError: If pattern doesn't match.
         """
-        if not isinstance(value, str):
-            self._raise_validation_error(
-                f"Expected string, got {type(value).__name__}",
-                value=value
-            )
+        # Pointer compare for the common exact-str case; subclasses still pass
+        if value.__class__ is not str and not isinstance(value, str):
+            self._raise_wrong_type("string", value)
         
         if pattern.fullmatch(value):
             return True
         
-        msg = error_message or f"Value does not match required pattern for {self.field_name or 'field'}"
+        msg = error_message or f"Value does not match required pattern for {self._field_label}"
         raise PatternMismatchError(
             pattern=str(pattern.pattern),
             value=value,
@@ -102,6 +193,45 @@ class BaseValidator(ABC):
         )
 
 
+class BatchMatchMixin:
+    """
+    validate_many() fast path for validators whose whole rule is _match_active.
+    
+    Strings accepted by the bound pattern are recorded without going through
+    validate(); everything else is passed to validate() so failures carry the
+    usual error. List it before BaseValidator in the bases.
+    """
+    
+    __slots__ = ()
+    
+    def validate_many(self, values: Iterable[Any]) -> List[Union[bool, ValidationError]]:
+        """
+        Validate many values in one call.
+        
+        Args:
+            values: Iterable of values to validate.
+            
+        Returns:
+            List with one entry per value: True if it passed, or the
+            ValidationError it raised.
+        """
+        fullmatch = self._fullmatch
+        validate = self.validate
+        
+        results: List[Union[bool, ValidationError]] = []
+        append = results.append
+        for value in values:
+            if value.__class__ is str and fullmatch(value) is not None:
+                append(True)
+                continue
+            try:
+                validate(value)
+                append(True)
+            except ValidationError as e:
+                append(e)
+        return results
+
+
 class CompositeValidator(BaseValidator):
     """
     Validator that combines multiple validators.
@@ -19,7 +19,8 @@ Purpose:
 - Enable flexible validation with custom constraints.
 """
 
-from typing import Optional, Pattern, Union, Any
+import math
+from typing import Optional, Pattern, Union, Any, Callable, Iterable, List, NoReturn
 
 from .core import BaseValidator
 from .patterns import (
@@ -28,6 +29,40 @@ from .patterns import (
 from ..exceptions import RangeError, InvalidTypeError, ValidationError
 
 
+
+def _build_range_checker(
+    min_value: Optional[Union[int, float]],
+    max_value: Optional[Union[int, float]],
+    min_inclusive: bool,
+    max_inclusive: bool
+) -> Callable[[Union[int, float]], bool]:
+    """
+    Return a predicate specialised for a fixed range configuration.
+    
+    The bound/inclusivity decisions are made here once, so the returned
+    function is a single comparison. It returns False for NaN, which callers
+    must route through the full check.
+    """
+    if min_value is None and max_value is None:
+        # Still compare, so values that cannot be ordered raise TypeError
+        return lambda v: v >= -math.inf
+    if min_value is None:
+        if max_inclusive:
+            return lambda v: v <= max_value
+        return lambda v: v < max_value
+    if max_value is None:
+        if min_inclusive:
+            return lambda v: v >= min_value
+        return lambda v: v > min_value
+    if min_inclusive and max_inclusive:
+        return lambda v: min_value <= v <= max_value
+    if min_inclusive:
+        return lambda v: min_value <= v < max_value
+    if max_inclusive:
+        return lambda v: min_value < v <= max_value
+    return lambda v: min_value < v < max_value
+
+
 class IntegerValidator(BaseValidator):
     """
     Validator for integer values.
@@ -36,6 +71,8 @@ class IntegerValidator(BaseValidator):
     Can accept custom regex patterns for specialized integer formats.
     """
     
+    __slots__ = ("positive_only", "negative_only", "pattern", "_err_invalid_format", "_validate_impl")
+    
     def __init__(
         self,
         positive_only: bool = False,
@@ -59,12 +96,18 @@ class IntegerValidator(BaseValidator):
         if positive_only and negative_only:
             raise ValueError("Cannot set both positive_only and negative_only to True")
         
-        if positive_only:
-            self.pattern = IntegerPattern.POSITIVE
-        elif negative_only:
-            self.pattern = IntegerPattern.NEGATIVE
+        # One pattern for every mode; the sign is enforced on the parsed int
+        self.pattern = IntegerPattern.PATTERN
+        
+        self._err_invalid_format = f"Invalid integer format for {self._field_label}"
+        self._bind_pattern(self.pattern)
+        
+        # The configuration is fixed here, so pick the validation path once
+        # instead of re-testing custom_pattern on every call
+        if custom_pattern is None:
+            self._validate_impl = self._validate_default
         else:
-            self.pattern = IntegerPattern.PATTERN
+            self._validate_impl = self._validate_custom
     
     def validate(self, value: Any) -> bool:
         """
@@ -79,46 +122,71 @@ class IntegerValidator(BaseValidator):
         Raises:
             ValidationError: If validation fails.
         """
-        # Convert to string if needed
-        if isinstance(value, int):
-            value_str = str(value)
-        elif isinstance(value, str):
-            value_str = value
-        else:
-            self._raise_validation_error(
-                f"Expected integer or string, got {type(value).__name__}",
-                value=value
-            )
+        return self._validate_impl(value)
+    
+    def _validate_default(self, value: Any) -> bool:
+        """Validate against the built-in integer syntax."""
+        # Native ints need no parsing (bool is excluded and rejected below)
+        if type(value) is int:
+            return self._check_sign(value)
+        
+        value_str = self._coerce_str(value)
+        
+        # Same syntax as IntegerPattern.PATTERN (optional sign, ASCII
+        # digits), checked in C; int() alone would also accept
+        # whitespace and underscores.
+        digits = value_str[1:] if value_str[:1] in ("+", "-") else value_str
+        if not (digits.isascii() and digits.isdecimal()):
+            self._raise_invalid_format(value)
+        
+        return self._check_sign(self._parse(value_str, value))
+    
+    def _validate_custom(self, value: Any) -> bool:
+        """Validate against the user-supplied pattern."""
+        value_str = self._coerce_str(value)
         
-        pattern = self.custom_pattern or self.pattern
-        if not pattern.fullmatch(value_str):
-            self._raise_validation_error(
-                f"Invalid integer format for {self.field_name or 'field'}",
-                value=value
-            )
+        if self._fullmatch(value_str) is None:
+            self._raise_invalid_format(value)
         
-        # Additional checks for positive/negative
+        return self._check_sign(self._parse(value_str, value))
+    
+    def _coerce_str(self, value: Any) -> str:
+        """Return value as a string, rejecting anything but str and int."""
+        if isinstance(value, str):
+            return value
+        if isinstance(value, int):
+            return str(value)
+        self._raise_wrong_type("integer or string", value)
+    
+    def _raise_invalid_format(self, value: Any) -> NoReturn:
+        self._raise_validation_error(self._err_invalid_format, value=value)
+    
+    def _parse(self, value_str: str, value: Any) -> int:
         try:
-            int_val = int(value_str)
-            if self.positive_only and int_val <= 0:
-                raise RangeError(
-                    min_value=1,
-                    actual_value=int_val,
-                    field=self.field_name,
-                    message=f"Integer must be positive for {self.field_name or 'field'}"
-                )
-            if self.negative_only and int_val >= 0:
-                raise RangeError(
-                    max_value=-1,
-                    actual_value=int_val,
-                    field=self.field_name,
-                    message=f"Integer must be negative for {self.field_name or 'field'}"
-                )
+            return int(value_str)
         except ValueError:
             self._raise_validation_error(
-                f"Invalid integer value: {value}",
+                template="Invalid integer value: {}",
+                template_args=(value,),
                 value=value
             )
+    
+    def _check_sign(self, int_val: int) -> bool:
+        """Apply the positive_only/negative_only constraints."""
+        if self.positive_only and int_val <= 0:
+            raise RangeError(
+                min_value=1,
+                actual_value=int_val,
+                field=self.field_name,
+                message=f"Integer must be positive for {self._field_label}"
+            )
+        if self.negative_only and int_val >= 0:
+            raise RangeError(
+                max_value=-1,
+                actual_value=int_val,
+                field=self.field_name,
+                message=f"Integer must be negative for {self._field_label}"
+            )
         
         return True
 
@@ -131,6 +199,8 @@ class FloatValidator(BaseValidator):
     Can accept custom regex patterns for specialized float formats.
     """
     
+    __slots__ = ("positive_only", "negative_only", "pattern", "_err_invalid_format")
+    
     def __init__(
         self,
         positive_only: bool = False,
@@ -160,6 +230,9 @@ class FloatValidator(BaseValidator):
             self.pattern = FloatPattern.NEGATIVE
         else:
             self.pattern = FloatPattern.PATTERN
+        
+        self._err_invalid_format = f"Invalid float format for {self._field_label}"
+        self._bind_pattern(self.pattern)
     
     def validate(self, value: Any) -> bool:
         """
@@ -174,45 +247,62 @@ class FloatValidator(BaseValidator):
         Raises:
             ValidationError: If validation fails.
         """
-        # Convert to string if needed
-        if isinstance(value, float):
-            value_str = str(value)
-        elif isinstance(value, str):
-            value_str = value
-        else:
-            self._raise_validation_error(
-                f"Expected float or string, got {type(value).__name__}",
-                value=value
-            )
-        
-        pattern = self.custom_pattern or self.pattern
-        if not pattern.fullmatch(value_str):
-            self._raise_validation_error(
-                f"Invalid float format for {self.field_name or 'field'}",
-                value=value
-            )
+        custom_pattern = self.custom_pattern
         
-        # Additional checks for positive/negative
-        try:
-            float_val = float(value_str)
-            if self.positive_only and float_val <= 0:
-                raise RangeError(
-                    min_value=0.0,
-                    actual_value=float_val,
-                    field=self.field_name,
-                    message=f"Float must be positive for {self.field_name or 'field'}"
+        # Native floats need no string round trip; only nan/inf are rejected
+        if custom_pattern is None and type(value) is float:
+            if not math.isfinite(value):
+                self._raise_validation_error(self._err_invalid_format, value=value)
+            float_val = value
+        else:
+            if isinstance(value, str):
+                value_str = value
+            elif isinstance(value, float):
+                value_str = str(value)
+            else:
+                self._raise_wrong_type("float or string", value)
+            
+            if custom_pattern is not None:
+                matched = self._fullmatch(value_str) is not None
+            else:
+                # Same syntax as FloatPattern.PATTERN: optional sign, one dot,
+                # ASCII digits on at least one side of it.
+                body = value_str[1:] if value_str[:1] in ("+", "-") else value_str
+                int_part, dot, frac_part = body.partition(".")
+                matched = (
+                    bool(dot)
+                    and body.isascii()
+                    and bool(int_part or frac_part)
+                    and (not int_part or int_part.isdecimal())
+                    and (not frac_part or frac_part.isdecimal())
                 )
-            if self.negative_only and float_val >= 0:
-                raise RangeError(
-                    max_value=0.0,
-                    actual_value=float_val,
-                    field=self.field_name,
-                    message=f"Float must be negative for {self.field_name or 'field'}"
+            
+            if not matched:
+                self._raise_validation_error(self._err_invalid_format, value=value)
+            
+            try:
+                float_val = float(value_str)
+            except ValueError:
+                self._raise_validation_error(
+                    template="Invalid float value: {}",
+                    template_args=(value,),
+                    value=value
                 )
-        except ValueError:
-            self._raise_validation_error(
-                f"Invalid float value: {value}",
-                value=value
+        
+        # Additional checks for positive/negative
+        if self.positive_only and float_val <= 0:
+            raise RangeError(
+                min_value=0.0,
+                actual_value=float_val,
+                field=self.field_name,
+                message=f"Float must be positive for {self._field_label}"
+            )
+        if self.negative_only and float_val >= 0:
+            raise RangeError(
+                max_value=0.0,
+                actual_value=float_val,
+                field=self.field_name,
+                message=f"Float must be negative for {self._field_label}"
             )
         
         return True
@@ -225,6 +315,8 @@ class RangeValidator(BaseValidator):
     Works with both integers and floats. Supports inclusive or exclusive bounds.
     """
     
+    __slots__ = ("min_value", "max_value", "min_inclusive", "max_inclusive", "_in_range")
+    
     def __init__(
         self,
         min_value: Optional[Union[int, float]] = None,
@@ -251,6 +343,8 @@ class RangeValidator(BaseValidator):
         
         if min_value is not None and max_value is not None and min_value > max_value:
             raise ValueError("min_value cannot be greater than max_value")
+        
+        self._in_range = _build_range_checker(min_value, max_value, min_inclusive, max_inclusive)
     
     def validate(self, value: Any) -> bool:
         """
@@ -265,19 +359,39 @@ class RangeValidator(BaseValidator):
         Raises:
             ValidationError: If validation fails.
         """
-        try:
-            num_value = float(value) if isinstance(value, str) else value
-            if not isinstance(num_value, (int, float)):
+        if isinstance(value, str):
+            try:
+                num_value = float(value)
+            except ValueError:
                 self._raise_validation_error(
-                    f"Expected numeric value, got {type(value).__name__}",
+                    template="Invalid numeric value: {}",
+                    template_args=(value,),
                     value=value
                 )
-        except (ValueError, TypeError):
-            self._raise_validation_error(
-                f"Invalid numeric value: {value}",
-                value=value
-            )
+        else:
+            num_value = value
+        
+        # Compare first: any real number orders against the bounds, anything
+        # else raises TypeError, so no isinstance ladder is needed up front.
+        # Decimal NaN raises InvalidOperation (an ArithmeticError) instead, and
+        # array-likes whose comparison has no single truth value ValueError.
+        try:
+            in_range = self._in_range(num_value)
+        except (TypeError, ValueError, ArithmeticError):
+            self._raise_wrong_type("numeric value", value)
         
+        if not in_range:
+            self._raise_range_error(num_value)
+        
+        return True
+    
+    def _raise_range_error(self, num_value: Union[int, float]) -> None:
+        """
+        Raise a RangeError naming the bound that num_value violates.
+        
+        Returns without raising when no bound rejects the value (NaN), which
+        keeps the original pass-through behaviour for it.
+        """
         if self.min_value is not None:
             if self.min_inclusive:
                 if num_value < self.min_value:
@@ -285,7 +399,7 @@ class RangeValidator(BaseValidator):
                         min_value=self.min_value,
                         actual_value=num_value,
                         field=self.field_name,
-                        message=f"Value must be at least {self.min_value} for {self.field_name or 'field'}"
+                        message=f"Value must be at least {self.min_value} for {self._field_label}"
                     )
             else:
                 if num_value <= self.min_value:
@@ -293,7 +407,7 @@ class RangeValidator(BaseValidator):
                         min_value=self.min_value,
                         actual_value=num_value,
                         field=self.field_name,
-                        message=f"Value must be greater than {self.min_value} for {self.field_name or 'field'}"
+                        message=f"Value must be greater than {self.min_value} for {self._field_label}"
                     )
         
         if self.max_value is not None:
@@ -303,7 +417,7 @@ class RangeValidator(BaseValidator):
                         max_value=self.max_value,
                         actual_value=num_value,
                         field=self.field_name,
-                        message=f"Value must be at most {self.max_value} for {self.field_name or 'field'}"
+                        message=f"Value must be at most {self.max_value} for {self._field_label}"
                     )
             else:
                 if num_value >= self.max_value:
@@ -311,10 +425,39 @@ class RangeValidator(BaseValidator):
                         max_value=self.max_value,
                         actual_value=num_value,
                         field=self.field_name,
-                        message=f"Value must be less than {self.max_value} for {self.field_name or 'field'}"
+                        message=f"Value must be less than {self.max_value} for {self._field_label}"
                     )
+    
+    def validate_many(self, values: Iterable[Any]) -> List[Union[bool, ValidationError]]:
+        """
+        Validate many values against the range in one call.
         
-        return True
+        Native ints and floats inside the bounds are accepted with a bare
+        comparison; anything else (strings, out-of-range values, NaN) goes
+        through validate() so results and errors match per-value calls.
+        
+        Args:
+            values: Iterable of values to validate.
+            
+        Returns:
+            List with one entry per value: True if it passed, or the
+            ValidationError it raised.
+        """
+        in_range = self._in_range
+        validate = self.validate
+        
+        results: List[Union[bool, ValidationError]] = []
+        append = results.append
+        for value in values:
+            if type(value) in (int, float) and in_range(value):
+                append(True)
+                continue
+            try:
+                validate(value)
+                append(True)
+            except ValidationError as e:
+                append(e)
+        return results
 
 
 class PercentageValidator(BaseValidator):
@@ -324,6 +467,8 @@ class PercentageValidator(BaseValidator):
     Accepts values with or without the % sign. Supports decimal percentages.
     """
     
+    __slots__ = ("pattern", "_err_invalid_format")
+    
     def __init__(
         self,
         custom_pattern: Optional[Pattern] = None,
@@ -338,6 +483,7 @@ class PercentageValidator(BaseValidator):
         """
         super().__init__(custom_pattern=custom_pattern, field_name=field_name)
         self.pattern = PercentagePattern.PATTERN
+        self._err_invalid_format = f"Invalid percentage format for {self._field_label}"
     
     def validate(self, value: Any) -> bool:
         """
@@ -355,12 +501,39 @@ class PercentageValidator(BaseValidator):
         if not isinstance(value, str):
             value = str(value)
         
-        pattern = self.custom_pattern or self.pattern
-        self._match_pattern(
-            value,
-            pattern,
-            error_message=f"Invalid percentage format for {self.field_name or 'field'}"
-        )
+        if self.custom_pattern is not None:
+            self._match_pattern(value, self.custom_pattern, error_message=self._err_invalid_format)
+            # A custom pattern may admit numbers past 100; hold those to 0..100
+            try:
+                percent = float(value[:-1] if value.endswith("%") else value)
+            except ValueError:
+                return True
+            if not 0.0 <= percent <= 100.0:
+                raise RangeError(
+                    min_value=0,
+                    max_value=100,
+                    actual_value=percent,
+                    field=self.field_name,
+                    message=f"Percentage must be between 0 and 100 for {self._field_label}"
+                )
+            return True
+        
+        # Same syntax as PercentagePattern.PATTERN, checked with str methods:
+        # 1-2 ASCII digits with an optional fraction, or 100 with an all-zero
+        # one, then an optional '%'. The regex only runs to build the error.
+        body = value[:-1] if value.endswith("%") else value
+        int_part, dot, frac_part = body.partition(".")
+        if int_part == "100":
+            well_formed = not dot or (frac_part != "" and not frac_part.strip("0"))
+        else:
+            well_formed = (
+                len(int_part) <= 2
+                and int_part.isdecimal()
+                and (not dot or frac_part.isdecimal())
+            )
+        if not (well_formed and body.isascii()):
+            self._match_pattern(value, self.pattern, error_message=self._err_invalid_format)
+        
         return True
 
 
@@ -371,6 +544,8 @@ class YearValidator(BaseValidator):
     Validates four-digit year strings. Can be extended with custom patterns.
     """
     
+    __slots__ = ("min_year", "max_year", "pattern", "_err_invalid_format")
+    
     def __init__(
         self,
         min_year: int = 1900,
@@ -391,6 +566,8 @@ class YearValidator(BaseValidator):
         self.min_year = min_year
         self.max_year = max_year
         self.pattern = YearPattern.PATTERN
+        self._err_invalid_format = f"Invalid year format for {self._field_label}"
+        self._bind_pattern(self.pattern)
     
     def validate(self, value: Any) -> bool:
         """
@@ -405,37 +582,49 @@ class YearValidator(BaseValidator):
         Raises:
             ValidationError: If validation fails.
         """
-        if isinstance(value, int):
-            value_str = str(value)
-        elif isinstance(value, str):
-            value_str = value
-        else:
-            self._raise_validation_error(
-                f"Expected year (int or string), got {type(value).__name__}",
-                value=value
-            )
-        
-        pattern = self.custom_pattern or self.pattern
-        if not pattern.fullmatch(value_str):
-            self._raise_validation_error(
-                f"Invalid year format for {self.field_name or 'field'}",
-                value=value
-            )
+        custom_pattern = self.custom_pattern
         
-        try:
-            year = int(value_str)
-            if year < self.min_year or year > self.max_year:
-                raise RangeError(
-                    min_value=self.min_year,
-                    max_value=self.max_year,
-                    actual_value=year,
-                    field=self.field_name,
-                    message=f"Year must be between {self.min_year} and {self.max_year}"
+        # Without a custom pattern, str methods enforce YearPattern's syntax
+        # (exactly four ASCII digits); the configured bounds replace its
+        # 1900-2099 range.
+        if custom_pattern is None and type(value) is int:
+            year = value
+        else:
+            if isinstance(value, int):
+                value_str = str(value)
+            elif isinstance(value, str):
+                value_str = value
+            else:
+                self._raise_wrong_type("year (int or string)", value)
+            
+            if custom_pattern is not None:
+                matched = self._fullmatch(value_str) is not None
+            else:
+                matched = (
+                    len(value_str) == 4
+                    and value_str.isascii()
+                    and value_str.isdecimal()
                 )
-        except ValueError:
-            self._raise_validation_error(
-                f"Invalid year value: {value}",
-                value=value
+            
+            if not matched:
+                self._raise_validation_error(self._err_invalid_format, value=value)
+            
+            try:
+                year = int(value_str)
+            except ValueError:
+                self._raise_validation_error(
+                    template="Invalid year value: {}",
+                    template_args=(value,),
+                    value=value
+                )
+        
+        if not self.min_year <= year <= self.max_year:
+            raise RangeError(
+                min_value=self.min_year,
+                max_value=self.max_year,
+                actual_value=year,
+                field=self.field_name,
+                message=f"Year must be between {self.min_year} and {self.max_year}"
             )
         
         return True
@@ -448,6 +637,8 @@ class AgeValidator(BaseValidator):
     Validates age strings and ensures they're within reasonable human age bounds.
     """
     
+    __slots__ = ("min_age", "max_age", "pattern", "_err_invalid_format")
+    
     def __init__(
         self,
         min_age: int = 0,
@@ -468,6 +659,8 @@ class AgeValidator(BaseValidator):
         self.min_age = min_age
         self.max_age = max_age
         self.pattern = AgePattern.PATTERN
+        self._err_invalid_format = f"Invalid age format for {self._field_label}"
+        self._bind_pattern(self.pattern)
     
     def validate(self, value: Any) -> bool:
         """
@@ -482,37 +675,49 @@ class AgeValidator(BaseValidator):
         Raises:
             ValidationError: If validation fails.
         """
-        if isinstance(value, int):
-            value_str = str(value)
-        elif isinstance(value, str):
-            value_str = value
-        else:
-            self._raise_validation_error(
-                f"Expected age (int or string), got {type(value).__name__}",
-                value=value
-            )
-        
-        pattern = self.custom_pattern or self.pattern
-        if not pattern.fullmatch(value_str):
-            self._raise_validation_error(
-                f"Invalid age format for {self.field_name or 'field'}",
-                value=value
-            )
+        custom_pattern = self.custom_pattern
         
-        try:
-            age = int(value_str)
-            if age < self.min_age or age > self.max_age:
-                raise RangeError(
-                    min_value=self.min_age,
-                    max_value=self.max_age,
-                    actual_value=age,
-                    field=self.field_name,
-                    message=f"Age must be between {self.min_age} and {self.max_age}"
+        # Without a custom pattern, str methods enforce AgePattern's syntax
+        # (ASCII digits, no leading zero except "0" itself); the configured
+        # bounds replace its 0-150 range.
+        if custom_pattern is None and type(value) is int:
+            age = value
+        else:
+            if isinstance(value, int):
+                value_str = str(value)
+            elif isinstance(value, str):
+                value_str = value
+            else:
+                self._raise_wrong_type("age (int or string)", value)
+            
+            if custom_pattern is not None:
+                matched = self._fullmatch(value_str) is not None
+            else:
+                matched = (
+                    value_str.isascii()
+                    and value_str.isdecimal()
+                    and (value_str[0] != "0" or value_str == "0")
                 )
-        except ValueError:
-            self._raise_validation_error(
-                f"Invalid age value: {value}",
-                value=value
+            
+            if not matched:
+                self._raise_validation_error(self._err_invalid_format, value=value)
+            
+            try:
+                age = int(value_str)
+            except ValueError:
+                self._raise_validation_error(
+                    template="Invalid age value: {}",
+                    template_args=(value,),
+                    value=value
+                )
+        
+        if not self.min_age <= age <= self.max_age:
+            raise RangeError(
+                min_value=self.min_age,
+                max_value=self.max_age,
+                actual_value=age,
+                field=self.field_name,
+                message=f"Age must be between {self.min_age} and {self.max_age}"
             )
         
         return True
@@ -14,23 +14,40 @@ Categories:
     - CommandPattern: Shell/CLI command strings.
     - MultiLineTextPattern: Detects multi-line text.
     - IntegerPattern, FloatPattern, PercentagePattern: Numeric string formats.
+    - NumericPattern: Single-pass int/float/percentage classification.
     - MobileNumberPattern: International phone numbers (with explicit Iran support).
     - BooleanPattern: Yes/No, True/False, confirmations.
     - PinPattern: PIN, API key, token and sensitive fields.
     - Additional patterns as necessary.
 
 Patterns are intended for use in validators and composable input logic.
+compile_pattern() provides cached compilation for patterns built at runtime.
+ALL_PATTERNS lists the built-in compiled patterns; warmup() exercises them at startup.
 """
 
 import re
-from typing import Pattern, Optional, Dict
+import string
+import functools
+from typing import Pattern, Optional, Dict, FrozenSet, Tuple
+
+
+@functools.lru_cache(maxsize=256)
+def compile_pattern(source: str, flags: int = 0) -> Pattern:
+    """
+    Compile a regex, reusing the compiled object for repeated (source, flags) pairs.
+
+    Used by validators that build patterns at construction time so that
+    creating many validators with the same pattern compiles it only once.
+    """
+    return re.compile(source, flags)
+
 
 class UsernamePattern:
     """
     Validation patterns for usernames, identifiers, and slugs.
     Supports strict (letters, digits, - and _) and relaxed (Unicode) modes.
     """
-    STRICT: Pattern = re.compile(r"^[a-zA-Z0-9_-]{3,32}$")
+    STRICT: Pattern = re.compile(r"^[a-zA-Z0-9_-]{3,32}$", re.ASCII)
     RELAXED: Pattern = re.compile(r"^[\w\-]{3,32}$", re.UNICODE)
 
     @classmethod
@@ -55,8 +72,9 @@ class EmailPattern:
     RFC 5322-compliant email validation (commonly used variant).
     """
     PATTERN: Pattern = re.compile(
-        r"^(?i)[a-z0-9!#$%&'*+/=?^_`{|}~-]+(?:\\.[a-z0-9!#$%&'*+/=?^_`{|}~-]+)*@"
-        r"(?:[a-z0-9](?:[a-z0-9-]*[a-z0-9])?\\.)+[a-z]{2,}$"
+        r"^[a-z0-9!#$%&'*+/=?^_`{|}~-]+(?:\.[a-z0-9!#$%&'*+/=?^_`{|}~-]+)*@"
+        r"(?:[a-z0-9](?:[a-z0-9-]*[a-z0-9])?\.)+[a-z]{2,}$",
+        re.IGNORECASE | re.ASCII
     )
 
     @classmethod
@@ -66,9 +84,14 @@ class EmailPattern:
 class URLPattern:
     """
     Patterns to match web URLs with HTTP(S)/FTP or file schemes.
+    The host is matched as an atomic group (lookahead + backreference, which
+    works before Python 3.11) so it cannot trade characters with the path
+    part; without that, failing inputs backtrack quadratically.
     """
     PATTERN: Pattern = re.compile(
-        r"^(?i)(https?|ftp|file)://[\w\-]+(\.[\w\-]+)+([:/?#\[\]@!$&'()*+,;=\w\-\.%]*)$"
+        r"^(https?|ftp|file)://(?=(?P<host>[\w\-]+(?:\.[\w\-]+)+))(?P=host)"
+        r"([:/?#\[\]@!$&'()*+,;=\w\-\.%]*)$",
+        re.IGNORECASE
     )
 
     @classmethod
@@ -80,7 +103,7 @@ class FilePathPattern:
     Unix and Windows file path pattern.
     Accepts absolute or relative paths, with folders/files/extensions.
     """
-    PATTERN: Pattern = re.compile(r"(^[a-zA-Z]:\\\\([\\w\\-. ]+\\\\)*[\\w\\-. ]+(\\.[\\w]+)?$|^(/[^/ ]*)+/?$)")
+    PATTERN: Pattern = re.compile(r"^(?:[A-Za-z]:\\(?:[\w\-. ]+\\)*[\w\-. ]+(?:\.\w+)?|(?:/[^/ ]+)+/?|/)$")
 
     @classmethod
     def is_valid(cls, value: str) -> bool:
@@ -109,28 +132,28 @@ class MultiLineTextPattern:
 class IntegerPattern:
     """
     Matches integer string (positive, negative, zero).
+    is_positive/is_negative check the sign of the parsed value (zero is neither).
     """
-    PATTERN: Pattern = re.compile(r"^[+-]?\d+$")
-    POSITIVE: Pattern = re.compile(r"^\+?\d+$")
-    NEGATIVE: Pattern = re.compile(r"^-\d+$")
+    PATTERN: Pattern = re.compile(r"^[+-]?\d+$", re.ASCII)
 
     @classmethod
     def is_valid(cls, value: str) -> bool:
         return bool(cls.PATTERN.fullmatch(value))
     @classmethod
     def is_positive(cls, value: str) -> bool:
-        return bool(cls.POSITIVE.fullmatch(value))
+        """Sign is decided on the parsed value, so one pattern serves all three checks."""
+        return cls.PATTERN.fullmatch(value) is not None and int(value) > 0
     @classmethod
     def is_negative(cls, value: str) -> bool:
-        return bool(cls.NEGATIVE.fullmatch(value))
+        return cls.PATTERN.fullmatch(value) is not None and int(value) < 0
 
 class FloatPattern:
     """
     Matches float string (with optional sign and decimals).
     """
-    PATTERN: Pattern = re.compile(r"^[+-]?(\d+\.\d+|\d+\.|\.\d+)$")
-    POSITIVE: Pattern = re.compile(r"^\+?(\d+\.\d+|\d+\.|\.\d+)$")
-    NEGATIVE: Pattern = re.compile(r"^-((\d+\.\d+)|(\d+\.)|(\.\d+))$")
+    PATTERN: Pattern = re.compile(r"^[+-]?(\d+\.\d+|\d+\.|\.\d+)$", re.ASCII)
+    POSITIVE: Pattern = re.compile(r"^\+?(\d+\.\d+|\d+\.|\.\d+)$", re.ASCII)
+    NEGATIVE: Pattern = re.compile(r"^-((\d+\.\d+)|(\d+\.)|(\.\d+))$", re.ASCII)
 
     @classmethod
     def is_valid(cls, value: str) -> bool:
@@ -146,18 +169,39 @@ class PercentagePattern:
     """
     Matches a percentage value string (0-100%, optional % sign).
     """
-    PATTERN: Pattern = re.compile(r"^(100(\.0+)?|\d{1,2}(\.\d+)?)%?$")
+    PATTERN: Pattern = re.compile(r"^(100(\.0+)?|\d{1,2}(\.\d+)?)%?$", re.ASCII)
 
     @classmethod
     def is_valid(cls, value: str) -> bool:
         return bool(cls.PATTERN.fullmatch(value))
 
+class NumericPattern:
+    """
+    Classifies a numeric string as integer, float or percentage in one match.
+    
+    The alternatives are tried in order (int, float, pct), so the first kind
+    that matches wins. Years and ages are integers as well and are not
+    separate groups; use YearPattern/AgePattern or the validators' bounds.
+    """
+    UNION: Pattern = re.compile(
+        r"(?P<int>[+-]?\d+)"
+        r"|(?P<float>[+-]?(?:\d+\.\d+|\d+\.|\.\d+))"
+        r"|(?P<pct>(?:100(?:\.0+)?|\d{1,2}(?:\.\d+)?)%)",
+        re.ASCII
+    )
+
+    @classmethod
+    def classify(cls, value: str) -> Optional[str]:
+        """Return 'int', 'float' or 'pct' for a numeric string, or None."""
+        match = cls.UNION.fullmatch(value)
+        return match.lastgroup if match else None
+
 class YearPattern:
     """
     Matches a four-digit year (>=1900, <= 2099).
     Use logic for stricter range if desired.
     """
-    PATTERN: Pattern = re.compile(r"^(19\d{2}|20\d{2})$")
+    PATTERN: Pattern = re.compile(r"^(19\d{2}|20\d{2})$", re.ASCII)
     @classmethod
     def is_valid(cls, value: str) -> bool:
         return bool(cls.PATTERN.fullmatch(value))
@@ -166,7 +210,7 @@ class AgePattern:
     """
     Matches an age from 0-150 as string.
     """
-    PATTERN: Pattern = re.compile(r"^(?:[1-9]?\d|1[01]\d|120|1[3-4][0-9]|150)$")
+    PATTERN: Pattern = re.compile(r"^(?:[1-9]?\d|1[01]\d|120|1[3-4][0-9]|150)$", re.ASCII)
     @classmethod
     def is_valid(cls, value: str) -> bool:
         return bool(cls.PATTERN.fullmatch(value))
@@ -175,37 +219,55 @@ class BooleanPattern:
     """
     Accepts yes/no, y/n, true/false, t/f, 0/1, on/off, etc. (Case insensitive).
     Used for CLI confirmation/boolean inputs.
+    VALUES holds the accepted lowercase tokens; PATTERN is kept for custom use.
     """
+    VALUES: FrozenSet[str] = frozenset({
+        "y", "yes", "n", "no", "true", "false", "t", "f", "1", "0",
+        "on", "off", "ok", "sure", "agree", "confirm", "cancel",
+    })
     PATTERN: Pattern = re.compile(
-        r"^(?i)(y(es)?|no?|true|false|t|f|1|0|on|off|ok|sure|agree|confirm|cancel)$"
+        r"^(y(es)?|no?|true|false|t|f|1|0|on|off|ok|sure|agree|confirm|cancel)$",
+        re.IGNORECASE | re.ASCII
     )
     @classmethod
     def is_valid(cls, value: str) -> bool:
-        return bool(cls.PATTERN.fullmatch(value))
+        return isinstance(value, str) and value.lower() in cls.VALUES
 
 class PinPattern:
     """
     Accepts a PIN number (4-12 digits, can adjust as needed).
     """
-    PATTERN: Pattern = re.compile(r"^\d{4,12}$")
+    PATTERN: Pattern = re.compile(r"^\d{4,12}$", re.ASCII)
     @classmethod
     def is_valid(cls, value: str) -> bool:
-        return bool(cls.PATTERN.fullmatch(value))
+        # Equivalent to PATTERN: isascii() limits isdecimal() to 0-9 like re.ASCII \d
+        return (
+            isinstance(value, str)
+            and 4 <= len(value) <= 12
+            and value.isascii()
+            and value.isdecimal()
+        )
 
 class ApiKeyPattern:
     """
     Accepts a generic API key (32-128 alphanumeric, may contain hyphens or underscores).
     """
-    PATTERN: Pattern = re.compile(r"^[A-Za-z0-9_-]{32,128}$")
+    PATTERN: Pattern = re.compile(r"^[A-Za-z0-9_-]{32,128}$", re.ASCII)
+    # translate() table deleting every allowed character; a valid key translates to ""
+    DELETE_ALLOWED: Dict[int, None] = str.maketrans("", "", string.ascii_letters + string.digits + "_-")
     @classmethod
     def is_valid(cls, value: str) -> bool:
-        return bool(cls.PATTERN.fullmatch(value))
+        return (
+            isinstance(value, str)
+            and 32 <= len(value) <= 128
+            and not value.translate(cls.DELETE_ALLOWED)
+        )
 
 class TokenPattern:
     """
     Accepts a generic token: JWT/Hex/Base64 (flexible, customizable per usage).
     """
-    PATTERN: Pattern = re.compile(r"^[A-Za-z0-9\-_.=]+$")
+    PATTERN: Pattern = re.compile(r"^[A-Za-z0-9\-_.=]+$", re.ASCII)
     @classmethod
     def is_valid(cls, value: str) -> bool:
         return bool(cls.PATTERN.fullmatch(value))
@@ -216,19 +278,69 @@ class MobileNumberPattern:
     For Iran (country code +98), includes the most common prefixes (e.g. 09xx, +989xx).
     To add or override patterns for a country, update COUNTRY_PATTERNS.
     """
-    E164: Pattern = re.compile(r"^\+\d{10,15}$")
-    IR_09X: Pattern = re.compile(r"^(\+98|0)?9\d{9}$")
+    E164: Pattern = re.compile(r"^\+\d{10,15}$", re.ASCII)
+    IR_09X: Pattern = re.compile(r"^(\+98|0)?9\d{9}$", re.ASCII)
     COUNTRY_PATTERNS: Dict[str, Pattern] = {
         "IR": IR_09X,
-        "US": re.compile(r"^(\+1)?[2-9]\d{2}[2-9](?!11)\d{6}$"),
-        "UK": re.compile(r"^(\+44|0)7\d{9}$"),
+        "US": re.compile(r"^(\+1)?[2-9]\d{2}[2-9](?!11)\d{6}$", re.ASCII),
+        "UK": re.compile(r"^(\+44|0)7\d{9}$", re.ASCII),
         # Add more country regexes here as needed.
     }
     @classmethod
     def is_valid(cls, value: str, country: Optional[str] = None) -> bool:
         if country:
             pattern = cls.COUNTRY_PATTERNS.get(country.upper())
+            if pattern is cls.IR_09X:
+                return cls.is_valid_ir(value)
             if pattern:
                 return bool(pattern.fullmatch(value))
-        return bool(cls.E164.fullmatch(value))
+        return cls.is_valid_e164(value)
 
+    @classmethod
+    def is_valid_e164(cls, value: str) -> bool:
+        """Same as E164.fullmatch: '+' then 10-15 ASCII digits."""
+        digits = value[1:]
+        return (
+            value[:1] == "+"
+            and 10 <= len(digits) <= 15
+            and digits.isascii()
+            and digits.isdecimal()
+        )
+
+    @classmethod
+    def is_valid_ir(cls, value: str) -> bool:
+        """Same as IR_09X.fullmatch: optional '+98' or '0', then '9' and 9 ASCII digits."""
+        if value.startswith("+98"):
+            value = value[3:]
+        elif value.startswith("0"):
+            value = value[1:]
+        return (
+            len(value) == 10
+            and value[0] == "9"
+            and value.isascii()
+            and value.isdecimal()
+        )
+
+
+# Every pattern this module compiles at import, for warmup() and introspection.
+ALL_PATTERNS: Tuple[Pattern, ...] = (
+    UsernamePattern.STRICT, UsernamePattern.RELAXED, FullNamePattern.PATTERN,
+    EmailPattern.PATTERN, URLPattern.PATTERN, FilePathPattern.PATTERN,
+    CommandPattern.PATTERN, MultiLineTextPattern.PATTERN,
+    IntegerPattern.PATTERN, FloatPattern.PATTERN, FloatPattern.POSITIVE, FloatPattern.NEGATIVE,
+    PercentagePattern.PATTERN, NumericPattern.UNION, YearPattern.PATTERN, AgePattern.PATTERN,
+    BooleanPattern.PATTERN, PinPattern.PATTERN, ApiKeyPattern.PATTERN, TokenPattern.PATTERN,
+    MobileNumberPattern.E164, *MobileNumberPattern.COUNTRY_PATTERNS.values(),
+)
+
+
+def warmup() -> None:
+    """
+    Exercise every built-in pattern once.
+
+    The patterns are compiled at import; call this during application startup
+    so that first-use costs inside the regex engine are not paid by the first
+    validated input.
+    """
+    for pattern in ALL_PATTERNS:
+        pattern.fullmatch("")
@@ -19,13 +19,42 @@ Purpose:
 """
 
 import re
-from typing import Optional, Pattern, Any, List
+import string
+from typing import Optional, Pattern, Any, Callable, List, Set, Tuple
 
-from .core import BaseValidator
-from .patterns import PinPattern, ApiKeyPattern, TokenPattern
+from .core import BaseValidator, BatchMatchMixin
+from .patterns import PinPattern, ApiKeyPattern, TokenPattern, compile_pattern
 from ..exceptions import PasswordStrengthError, ValidationError, LengthError
 
 
+# Password character classes, tested against the set of a password's characters
+_UPPERCASE = frozenset(string.ascii_uppercase)
+_LOWERCASE = frozenset(string.ascii_lowercase)
+_DIGITS = frozenset(string.digits)
+_SPECIAL_CHARS = frozenset('!@#$%^&*(),.?":{}|<>')
+# Unicode-aware digit class for passwords with non-ASCII characters
+_RE_DIGIT = re.compile(r'\d')
+
+
+# Character requirement checks, called as check(chars, value) with
+# chars = set(value); each returns True when the class is missing
+def _lacks_uppercase(chars: Set[str], value: str) -> bool:
+    return chars.isdisjoint(_UPPERCASE)
+
+
+def _lacks_lowercase(chars: Set[str], value: str) -> bool:
+    return chars.isdisjoint(_LOWERCASE)
+
+
+def _lacks_digit(chars: Set[str], value: str) -> bool:
+    # \d also matches non-ASCII decimal digits, which only a regex finds
+    return chars.isdisjoint(_DIGITS) and (value.isascii() or not _RE_DIGIT.search(value))
+
+
+def _lacks_special(chars: Set[str], value: str) -> bool:
+    return chars.isdisjoint(_SPECIAL_CHARS)
+
+
 class PasswordValidator(BaseValidator):
     """
     Validator for password strength and security requirements.
@@ -42,7 +71,8 @@ class PasswordValidator(BaseValidator):
         require_digit: bool = True,
         require_special: bool = True,
         custom_pattern: Optional[Pattern] = None,
-        field_name: Optional[str] = None
+        field_name: Optional[str] = None,
+        collect_all_reasons: bool = True
     ):
         """
         Initialize password validator.
@@ -55,6 +85,8 @@ class PasswordValidator(BaseValidator):
             require_special: Require at least one special character.
             custom_pattern: Optional custom regex pattern.
             field_name: Optional field name for error messages.
+            collect_all_reasons: If False, stop at the first unmet requirement
+                and report only that one.
         """
         super().__init__(custom_pattern=custom_pattern, field_name=field_name)
         self.min_length = min_length
@@ -62,6 +94,19 @@ class PasswordValidator(BaseValidator):
         self.require_lowercase = require_lowercase
         self.require_digit = require_digit
         self.require_special = require_special
+        self.collect_all_reasons = collect_all_reasons
+        
+        # Only the requirements enabled here are checked per call
+        checks: List[Tuple[Callable[[Set[str], str], bool], str]] = []
+        if require_uppercase:
+            checks.append((_lacks_uppercase, "Password must contain at least one uppercase letter"))
+        if require_lowercase:
+            checks.append((_lacks_lowercase, "Password must contain at least one lowercase letter"))
+        if require_digit:
+            checks.append((_lacks_digit, "Password must contain at least one digit"))
+        if require_special:
+            checks.append((_lacks_special, "Password must contain at least one special character"))
+        self._char_checks = tuple(checks)
     
     def validate(self, value: Any) -> bool:
         """
@@ -76,11 +121,8 @@ class PasswordValidator(BaseValidator):
         Raises:
             PasswordStrengthError: If password doesn't meet requirements.
         """
-        if not isinstance(value, str):
-            self._raise_validation_error(
-                f"Expected string, got {type(value).__name__}",
-                value=value
-            )
+        if value.__class__ is not str and not isinstance(value, str):
+            self._raise_wrong_type("string", value)
         
         if self.custom_pattern:
             self._match_pattern(value, self.custom_pattern)
@@ -91,18 +133,16 @@ class PasswordValidator(BaseValidator):
         if len(value) < self.min_length:
             reasons.append(f"Password must be at least {self.min_length} characters long")
         
-        # Character requirement checks
-        if self.require_uppercase and not re.search(r'[A-Z]', value):
-            reasons.append("Password must contain at least one uppercase letter")
-        
-        if self.require_lowercase and not re.search(r'[a-z]', value):
-            reasons.append("Password must contain at least one lowercase letter")
-        
-        if self.require_digit and not re.search(r'\d', value):
-            reasons.append("Password must contain at least one digit")
-        
-        if self.require_special and not re.search(r'[!@#$%^&*(),.?":{}|<>]', value):
-            reasons.append("Password must contain at least one special character")
+        # Character requirement checks: one pass builds the character set,
+        # then each enabled class is a hash-table disjointness test
+        collect_all = self.collect_all_reasons
+        if self._char_checks and (collect_all or not reasons):
+            chars = set(value)
+            for lacks, reason in self._char_checks:
+                if lacks(chars, value):
+                    reasons.append(reason)
+                    if not collect_all:
+                        break
         
         if reasons:
             raise PasswordStrengthError(
@@ -140,7 +180,9 @@ class PinValidator(BaseValidator):
         super().__init__(custom_pattern=custom_pattern, field_name=field_name)
         self.min_length = min_length
         self.max_length = max_length
-        self.pattern = re.compile(rf"^\d{{{min_length},{max_length}}}$")
+        # Shared across validators with the same bounds
+        self.pattern = compile_pattern(rf"^\d{{{min_length},{max_length}}}$", re.ASCII)
+        self._bind_pattern(self.pattern, f"PIN must be {self.min_length}-{self.max_length} digits for {self._field_label}")
     
     def validate(self, value: Any) -> bool:
         """
@@ -158,13 +200,16 @@ class PinValidator(BaseValidator):
         if not isinstance(value, str):
             value = str(value)
         
-        pattern = self.custom_pattern or self.pattern
-        self._match_pattern(
-            value,
-            pattern,
-            error_message=f"PIN must be {self.min_length}-{self.max_length} digits for {self.field_name or 'field'}"
-        )
-        return True
+        # Default rule is "min..max ASCII digits": a length test and a C digit
+        # scan decide it, and the regex only runs to report a failure
+        if self.custom_pattern is None and (
+            self.min_length <= len(value) <= self.max_length
+            and value.isascii()
+            and value.isdecimal()
+        ):
+            return True
+        
+        return self._match_active(value)
 
 
 class ApiKeyValidator(BaseValidator):
@@ -194,6 +239,7 @@ class ApiKeyValidator(BaseValidator):
         self.min_length = min_length
         self.max_length = max_length
         self.pattern = ApiKeyPattern.PATTERN
+        self._bind_pattern(self.pattern, f"Invalid API key format for {self._field_label}")
     
     def validate(self, value: Any) -> bool:
         """
@@ -208,11 +254,8 @@ class ApiKeyValidator(BaseValidator):
         Raises:
             ValidationError: If validation fails.
         """
-        if not isinstance(value, str):
-            self._raise_validation_error(
-                f"Expected string, got {type(value).__name__}",
-                value=value
-            )
+        if value.__class__ is not str and not isinstance(value, str):
+            self._raise_wrong_type("string", value)
         
         length = len(value)
         if length < self.min_length or length > self.max_length:
@@ -224,16 +267,15 @@ class ApiKeyValidator(BaseValidator):
                 message=f"API key must be {self.min_length}-{self.max_length} characters long"
             )
         
-        pattern = self.custom_pattern or self.pattern
-        self._match_pattern(
-            value,
-            pattern,
-            error_message=f"Invalid API key format for {self.field_name or 'field'}"
-        )
-        return True
+        # ApiKeyPattern.is_valid is a str.translate scan equivalent to the
+        # default regex; the regex only runs to report a failure
+        if self.custom_pattern is None and ApiKeyPattern.is_valid(value):
+            return True
+        
+        return self._match_active(value)
 
 
-class TokenValidator(BaseValidator):
+class TokenValidator(BatchMatchMixin, BaseValidator):
     """
     Validator for tokens (JWT, hex, base64, etc.).
     
@@ -254,6 +296,7 @@ class TokenValidator(BaseValidator):
         """
         super().__init__(custom_pattern=custom_pattern, field_name=field_name)
         self.pattern = TokenPattern.PATTERN
+        self._bind_pattern(self.pattern, f"Invalid token format for {self._field_label}")
     
     def validate(self, value: Any) -> bool:
         """
@@ -268,19 +311,7 @@ class TokenValidator(BaseValidator):
         Raises:
             ValidationError: If validation fails.
         """
-        if not isinstance(value, str):
-            self._raise_validation_error(
-                f"Expected string, got {type(value).__name__}",
-                value=value
-            )
-        
-        pattern = self.custom_pattern or self.pattern
-        self._match_pattern(
-            value,
-            pattern,
-            error_message=f"Invalid token format for {self.field_name or 'field'}"
-        )
-        return True
+        return self._match_active(value)
 
 
 class SecretTextValidator(BaseValidator):
@@ -310,6 +341,12 @@ class SecretTextValidator(BaseValidator):
         super().__init__(custom_pattern=custom_pattern, field_name=field_name)
         self.min_length = min_length
         self.max_length = max_length
+        
+        # Bounds are fixed here, so choose the length test once
+        if max_length:
+            self._length_ok = lambda n: min_length <= n <= max_length
+        else:
+            self._length_ok = lambda n: n >= min_length
     
     def validate(self, value: Any) -> bool:
         """
@@ -324,13 +361,20 @@ class SecretTextValidator(BaseValidator):
         Raises:
             ValidationError: If validation fails.
         """
-        if not isinstance(value, str):
-            self._raise_validation_error(
-                f"Expected string, got {type(value).__name__}",
-                value=value
-            )
+        if value.__class__ is not str and not isinstance(value, str):
+            self._raise_wrong_type("string", value)
         
         length = len(value)
+        if not self._length_ok(length):
+            self._raise_length_error(length)
+        
+        if self.custom_pattern:
+            self._match_pattern(value, self.custom_pattern)
+        
+        return True
+    
+    def _raise_length_error(self, length: int) -> None:
+        """Raise a LengthError naming the bound that length violates."""
         if length < self.min_length:
             raise LengthError(
                 min_length=self.min_length,
@@ -346,8 +390,3 @@ class SecretTextValidator(BaseValidator):
                 field=self.field_name,
                 message=f"Secret text must be at most {self.max_length} characters long"
             )
-        
-        if self.custom_pattern:
-            self._match_pattern(value, self.custom_pattern)
-        
-        return True
@@ -20,16 +20,21 @@ Purpose:
 """
 
 import re
+import string
 from typing import Optional, Pattern, Any
 
-from .core import BaseValidator
+from .core import BaseValidator, BatchMatchMixin
 from .patterns import (
     UsernamePattern, FullNamePattern, EmailPattern, URLPattern,
-    FilePathPattern, CommandPattern, MultiLineTextPattern
+    FilePathPattern, CommandPattern, MultiLineTextPattern, compile_pattern
 )
 from ..exceptions import LengthError, ValidationError
 
 
+# translate() table deleting every slug character; a valid slug translates to ""
+_SLUG_DELETE = str.maketrans("", "", string.ascii_lowercase + string.digits + "-")
+
+
 class PlainTextValidator(BaseValidator):
     """
     Validator for plain text input with optional length constraints.
@@ -71,15 +76,14 @@ class PlainTextValidator(BaseValidator):
         Raises:
             ValidationError: If validation fails.
         """
-        if not isinstance(value, str):
-            self._raise_validation_error(
-                f"Expected string, got {type(value).__name__}",
-                value=value
-            )
+        if value.__class__ is not str and not isinstance(value, str):
+            self._raise_wrong_type("string", value)
         
-        if not value.strip():
+        # isspace() scans without allocating the stripped copy
+        if not value or value.isspace():
             self._raise_validation_error(
-                f"Text cannot be empty for {self.field_name or 'field'}",
+                template="Text cannot be empty for {}",
+                template_args=(self._field_label,),
                 value=value
             )
         
@@ -106,7 +110,7 @@ class PlainTextValidator(BaseValidator):
         return True
 
 
-class UsernameValidator(BaseValidator):
+class UsernameValidator(BatchMatchMixin, BaseValidator):
     """
     Validator for usernames and identifiers.
     
@@ -131,6 +135,7 @@ class UsernameValidator(BaseValidator):
         super().__init__(custom_pattern=custom_pattern, field_name=field_name)
         self.strict = strict
         self.pattern = UsernamePattern.STRICT if strict else UsernamePattern.RELAXED
+        self._bind_pattern(self.pattern, f"Invalid username format for {self._field_label}")
     
     def validate(self, value: Any) -> bool:
         """
@@ -145,16 +150,10 @@ class UsernameValidator(BaseValidator):
         Raises:
             ValidationError: If validation fails.
         """
-        pattern = self.custom_pattern or self.pattern
-        self._match_pattern(
-            value,
-            pattern,
-            error_message=f"Invalid username format for {self.field_name or 'field'}"
-        )
-        return True
+        return self._match_active(value)
 
 
-class FullNameValidator(BaseValidator):
+class FullNameValidator(BatchMatchMixin, BaseValidator):
     """
     Validator for full names with multilingual support.
     
@@ -176,6 +175,7 @@ class FullNameValidator(BaseValidator):
         """
         super().__init__(custom_pattern=custom_pattern, field_name=field_name)
         self.pattern = FullNamePattern.PATTERN
+        self._bind_pattern(self.pattern, f"Invalid full name format for {self._field_label}")
     
     def validate(self, value: Any) -> bool:
         """
@@ -190,16 +190,10 @@ class FullNameValidator(BaseValidator):
         Raises:
             ValidationError: If validation fails.
         """
-        pattern = self.custom_pattern or self.pattern
-        self._match_pattern(
-            value,
-            pattern,
-            error_message=f"Invalid full name format for {self.field_name or 'field'}"
-        )
-        return True
+        return self._match_active(value)
 
 
-class EmailValidator(BaseValidator):
+class EmailValidator(BatchMatchMixin, BaseValidator):
     """
     Validator for email addresses using RFC 5322-compliant patterns.
     
@@ -220,6 +214,7 @@ class EmailValidator(BaseValidator):
         """
         super().__init__(custom_pattern=custom_pattern, field_name=field_name)
         self.pattern = EmailPattern.PATTERN
+        self._bind_pattern(self.pattern, f"Invalid email format for {self._field_label}")
     
     def validate(self, value: Any) -> bool:
         """
@@ -234,16 +229,10 @@ class EmailValidator(BaseValidator):
         Raises:
             ValidationError: If validation fails.
         """
-        pattern = self.custom_pattern or self.pattern
-        self._match_pattern(
-            value,
-            pattern,
-            error_message=f"Invalid email format for {self.field_name or 'field'}"
-        )
-        return True
+        return self._match_active(value)
 
 
-class URLValidator(BaseValidator):
+class URLValidator(BatchMatchMixin, BaseValidator):
     """
     Validator for URLs (HTTP, HTTPS, FTP, file protocols).
     
@@ -264,6 +253,7 @@ class URLValidator(BaseValidator):
         """
         super().__init__(custom_pattern=custom_pattern, field_name=field_name)
         self.pattern = URLPattern.PATTERN
+        self._bind_pattern(self.pattern, f"Invalid URL format for {self._field_label}")
     
     def validate(self, value: Any) -> bool:
         """
@@ -278,16 +268,10 @@ class URLValidator(BaseValidator):
         Raises:
             ValidationError: If validation fails.
         """
-        pattern = self.custom_pattern or self.pattern
-        self._match_pattern(
-            value,
-            pattern,
-            error_message=f"Invalid URL format for {self.field_name or 'field'}"
-        )
-        return True
+        return self._match_active(value)
 
 
-class FilePathValidator(BaseValidator):
+class FilePathValidator(BatchMatchMixin, BaseValidator):
     """
     Validator for file paths (Unix and Windows).
     
@@ -308,6 +292,7 @@ class FilePathValidator(BaseValidator):
         """
         super().__init__(custom_pattern=custom_pattern, field_name=field_name)
         self.pattern = FilePathPattern.PATTERN
+        self._bind_pattern(self.pattern, f"Invalid file path format for {self._field_label}")
     
     def validate(self, value: Any) -> bool:
         """
@@ -322,16 +307,10 @@ class FilePathValidator(BaseValidator):
         Raises:
             ValidationError: If validation fails.
         """
-        pattern = self.custom_pattern or self.pattern
-        self._match_pattern(
-            value,
-            pattern,
-            error_message=f"Invalid file path format for {self.field_name or 'field'}"
-        )
-        return True
+        return self._match_active(value)
 
 
-class CommandValidator(BaseValidator):
+class CommandValidator(BatchMatchMixin, BaseValidator):
     """
     Validator for CLI command strings.
     
@@ -353,6 +332,7 @@ class CommandValidator(BaseValidator):
         """
         super().__init__(custom_pattern=custom_pattern, field_name=field_name)
         self.pattern = CommandPattern.PATTERN
+        self._bind_pattern(self.pattern, f"Invalid command format for {self._field_label}")
     
     def validate(self, value: Any) -> bool:
         """
@@ -367,13 +347,7 @@ class CommandValidator(BaseValidator):
         Raises:
             ValidationError: If validation fails.
         """
-        pattern = self.custom_pattern or self.pattern
-        self._match_pattern(
-            value,
-            pattern,
-            error_message=f"Invalid command format for {self.field_name or 'field'}"
-        )
-        return True
+        return self._match_active(value)
 
 
 class MultiLineTextValidator(BaseValidator):
@@ -414,16 +388,14 @@ class MultiLineTextValidator(BaseValidator):
         Raises:
             ValidationError: If validation fails.
         """
-        if not isinstance(value, str):
-            self._raise_validation_error(
-                f"Expected string, got {type(value).__name__}",
-                value=value
-            )
+        if value.__class__ is not str and not isinstance(value, str):
+            self._raise_wrong_type("string", value)
         
-        lines = value.split('\n')
-        if len(lines) < self.min_lines:
+        # Line count without building the list of lines
+        if value.count('\n') + 1 < self.min_lines:
             self._raise_validation_error(
-                f"Text must contain at least {self.min_lines} lines",
+                template="Text must contain at least {} lines",
+                template_args=(self.min_lines,),
                 value=value
             )
         
@@ -431,7 +403,8 @@ class MultiLineTextValidator(BaseValidator):
             self._match_pattern(value, self.custom_pattern)
         elif not self.pattern.match(value):
             self._raise_validation_error(
-                f"Invalid multiline text format for {self.field_name or 'field'}",
+                template="Invalid multiline text format for {}",
+                template_args=(self._field_label,),
                 value=value
             )
         
@@ -459,7 +432,8 @@ class SlugValidator(BaseValidator):
         """
         super().__init__(custom_pattern=custom_pattern, field_name=field_name)
         # Slug pattern: lowercase letters, numbers, hyphens only
-        self.pattern = re.compile(r"^[a-z0-9-]{3,64}$")
+        self.pattern = compile_pattern(r"^[a-z0-9-]{3,64}$", re.ASCII)
+        self._bind_pattern(self.pattern, f"Invalid slug format for {self._field_label}")
     
     def validate(self, value: Any) -> bool:
         """
@@ -474,10 +448,14 @@ class SlugValidator(BaseValidator):
         Raises:
             ValidationError: If validation fails.
         """
-        pattern = self.custom_pattern or self.pattern
-        self._match_pattern(
-            value,
-            pattern,
-            error_message=f"Invalid slug format for {self.field_name or 'field'}"
-        )
-        return True
+        # Same test as the default pattern in one C pass; the regex only runs
+        # to report a failure
+        if (
+            self.custom_pattern is None
+            and isinstance(value, str)
+            and 3 <= len(value) <= 64
+            and not value.translate(_SLUG_DELETE)
+        ):
+            return True
+        
+        return self._match_active(value)
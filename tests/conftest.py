@@ -0,0 +1,63 @@
+"""
+Shared pytest fixtures for the inputkit test suite.
+"""
+import functools
+
+import pytest
+from inputkit.validators.security import PasswordValidator
+from inputkit.validators.strings import EmailValidator, URLValidator
+
+
+@functools.lru_cache(maxsize=None)
+def _build_validator(cls, *args, **kwargs):
+    return cls(*args, **kwargs)
+
+
+@pytest.fixture(scope="session")
+def make_validator():
+    """
+    ``make_validator(cls, *args, **kwargs)`` builds each configuration once.
+
+    Validators keep no per-call state, so tests asking for the same class and
+    arguments share one instance. All arguments must be hashable.
+    """
+    return _build_validator
+
+
+@pytest.fixture(scope="session")
+def default_email_validator():
+    return EmailValidator()
+
+
+@pytest.fixture(scope="session")
+def default_url_validator():
+    return URLValidator()
+
+
+@pytest.fixture(scope="session")
+def default_password_validator():
+    return PasswordValidator()
+
+
+@pytest.fixture
+def patched_terminal(monkeypatch):
+    """
+    Script a handler's terminal with canned replies.
+
+    Returns a callable ``patch(handler, *responses, method="read_line")``
+    that sets the reader directly on ``handler.terminal`` and silences
+    ``write``; monkeypatch restores both attributes on teardown. A single
+    response is returned on every read, several are returned in order.
+    """
+    def patch(handler, *responses, method="read_line"):
+        if len(responses) == 1:
+            reply = responses[0]
+            reader = lambda *args: reply
+        else:
+            next_reply = iter(responses).__next__
+            reader = lambda *args: next_reply()
+        monkeypatch.setattr(handler.terminal, method, reader)
+        monkeypatch.setattr(handler.terminal, "write", lambda *args, **kwargs: None)
+        return handler
+
+    return patch
@@ -4,9 +4,7 @@ Test suite for inputkit.input.core module.
 Tests BaseInputHandler functionality including retry logic, defaults, validation, etc.
 """
 import pytest
-from unittest.mock import Mock, patch
 from inputkit.input.core import BaseInputHandler
-from inputkit.validators.core import BaseValidator
 from inputkit.exceptions import ValidationError, EmptyInputError, RetryLimitExceeded
 
 
@@ -20,34 +18,64 @@ class ConcreteInputHandler(BaseInputHandler):
         return raw_input.strip()
 
 
+class _FakeValidator:
+    """Validator stand-in that records calls, without mock bookkeeping."""
+    
+    def __init__(self, result=True, exc=None):
+        self.calls = []
+        self._result = result
+        self._exc = exc
+    
+    def validate(self, value):
+        self.calls.append(value)
+        if self._exc is not None:
+            raise self._exc
+        return self._result
+
+
+@pytest.fixture(scope="module")
+def default_handler():
+    """Read-only handler with a default value, shared across tests."""
+    return ConcreteInputHandler(prompt="Test", default="default")
+
+
+@pytest.fixture(scope="module")
+def help_handler():
+    """Read-only handler with help text, shared across tests."""
+    return ConcreteInputHandler(prompt="Test", help_text="Help text")
+
+
+@pytest.fixture(scope="module")
+def hint_handler():
+    """Read-only handler with a hint, shared across tests."""
+    return ConcreteInputHandler(prompt="Test", hint="Hint text")
+
+
 class TestBaseInputHandler:
-    def test_init(self):
-        handler = ConcreteInputHandler(prompt="Test", default="default")
-        assert handler.prompt == "Test"
-        assert handler.default == "default"
+    def test_init(self, default_handler):
+        assert default_handler.prompt == "Test"
+        assert default_handler.default == "default"
     
-    def test_format_prompt_with_default(self):
-        handler = ConcreteInputHandler(prompt="Test", default="default")
-        prompt = handler._format_prompt()
+    def test_format_prompt_with_default(self, default_handler):
+        prompt = default_handler._format_prompt()
         assert "Test" in prompt
         assert "default" in prompt
     
-    def test_format_prompt_with_help(self):
-        handler = ConcreteInputHandler(prompt="Test", help_text="Help text")
-        prompt = handler._format_prompt()
+    def test_format_prompt_with_help(self, help_handler):
+        prompt = help_handler._format_prompt()
         assert "?" in prompt
     
-    def test_format_prompt_with_hint(self):
-        handler = ConcreteInputHandler(prompt="Test", hint="Hint text")
-        prompt = handler._format_prompt()
+    def test_format_prompt_with_hint(self, hint_handler):
+        prompt = hint_handler._format_prompt()
         assert "Hint" in prompt
     
-    def test_handle_help_request(self):
+    def test_handle_help_request(self, monkeypatch):
         handler = ConcreteInputHandler(prompt="Test", help_text="Help text")
-        with patch.object(handler.terminal, 'write') as mock_write:
-            result = handler._handle_help_request("?")
-            assert result is True
-            mock_write.assert_called_once()
+        written = []
+        monkeypatch.setattr(handler.terminal, 'write', written.append)
+        result = handler._handle_help_request("?")
+        assert result is True
+        assert written == ["Help text\n"]
     
     def test_process_input_with_default(self):
         handler = ConcreteInputHandler(prompt="Test", default="default", required=False)
@@ -60,31 +88,28 @@ class TestBaseInputHandler:
             handler._process_input("")
     
     def test_process_input_with_validation(self):
-        validator = Mock(spec=BaseValidator)
-        validator.validate = Mock()
+        validator = _FakeValidator()
         handler = ConcreteInputHandler(prompt="Test", validator=validator)
         handler._process_input("test")
-        validator.validate.assert_called_once_with("test")
+        assert validator.calls == ["test"]
     
-    @patch('builtins.input', return_value='test')
-    def test_get_success(self, mock_input):
+    def test_get_success(self, patched_terminal):
         handler = ConcreteInputHandler(prompt="Test")
-        with patch.object(handler.terminal, 'read_line', return_value='test'):
-            handler.terminal.read_line = Mock(return_value='test')
-            result = handler.get()
-            assert result == "test"
+        patched_terminal(handler, 'test')
+        result = handler.get()
+        assert result == "test"
     
-    def test_get_with_default(self):
+    def test_get_with_default(self, patched_terminal):
         handler = ConcreteInputHandler(prompt="Test", default="default", required=False)
-        with patch.object(handler.terminal, 'read_line', return_value=''):
-            result = handler.get()
-            assert result == "default"
+        patched_terminal(handler, '')
+        result = handler.get()
+        assert result == "default"
     
-    def test_get_retry_on_validation_error(self):
-        validator = Mock(spec=BaseValidator)
-        validator.validate = Mock(side_effect=ValidationError("Invalid"))
-        handler = ConcreteInputHandler(prompt="Test", validator=validator, retry_limit=2)
-        with patch.object(handler.terminal, 'read_line', return_value='invalid'):
-            with pytest.raises(RetryLimitExceeded):
-                handler.get()
+    def test_get_retry_on_validation_error(self, patched_terminal):
+        validator = _FakeValidator(exc=ValidationError("Invalid"))
+        handler = ConcreteInputHandler(prompt="Test", validator=validator, retry_limit=1)
+        patched_terminal(handler, 'invalid')
+        with pytest.raises(RetryLimitExceeded):
+            handler.get()
+        assert validator.calls == ["invalid"]
 
@@ -4,7 +4,6 @@ Test suite for inputkit.input.numeric module.
 Tests all numeric input handlers.
 """
 import pytest
-from unittest.mock import patch
 from inputkit.input.numeric import (
     IntegerInputHandler, FloatInputHandler, RangeNumberInputHandler,
     PercentageInputHandler, YearInputHandler, AgeInputHandler
@@ -12,74 +11,26 @@ from inputkit.input.numeric import (
 from inputkit.exceptions import ValidationError
 
 
-class TestIntegerInputHandler:
-    def test_get_integer(self):
-        handler = IntegerInputHandler(prompt="Enter integer")
-        with patch.object(handler.terminal, 'read_line', return_value='123'):
-            result = handler.get()
-            assert result == 123
-    
-    def test_get_positive_integer(self):
-        handler = IntegerInputHandler(prompt="Enter integer", positive_only=True)
-        with patch.object(handler.terminal, 'read_line', return_value='-5'):
-            with pytest.raises(ValidationError):
-                handler.get()
-    
-    def test_get_negative_integer(self):
-        handler = IntegerInputHandler(prompt="Enter integer", negative_only=True)
-        with patch.object(handler.terminal, 'read_line', return_value='-5'):
-            result = handler.get()
-            assert result == -5
-
-
-class TestFloatInputHandler:
-    def test_get_float(self):
-        handler = FloatInputHandler(prompt="Enter number")
-        with patch.object(handler.terminal, 'read_line', return_value='3.14'):
-            result = handler.get()
-            assert result == 3.14
-
-
-class TestRangeNumberInputHandler:
-    def test_get_in_range(self):
-        handler = RangeNumberInputHandler(prompt="Enter number", min_value=1, max_value=100)
-        with patch.object(handler.terminal, 'read_line', return_value='50'):
-            result = handler.get()
-            assert result == 50
-    
-    def test_get_out_of_range(self):
-        handler = RangeNumberInputHandler(prompt="Enter number", min_value=1, max_value=100)
-        with patch.object(handler.terminal, 'read_line', return_value='150'):
-            with pytest.raises(ValidationError):
-                handler.get()
-
-
-class TestPercentageInputHandler:
-    def test_get_percentage(self):
-        handler = PercentageInputHandler(prompt="Enter percentage")
-        with patch.object(handler.terminal, 'read_line', return_value='50'):
-            result = handler.get()
-            assert result == 50.0
-    
-    def test_get_percentage_with_sign(self):
-        handler = PercentageInputHandler(prompt="Enter percentage")
-        with patch.object(handler.terminal, 'read_line', return_value='75%'):
-            result = handler.get()
-            assert result == 75.0
-
-
-class TestYearInputHandler:
-    def test_get_year(self):
-        handler = YearInputHandler(prompt="Enter year")
-        with patch.object(handler.terminal, 'read_line', return_value='2023'):
-            result = handler.get()
-            assert result == 2023
-
-
-class TestAgeInputHandler:
-    def test_get_age(self):
-        handler = AgeInputHandler(prompt="Enter age")
-        with patch.object(handler.terminal, 'read_line', return_value='25'):
-            result = handler.get()
-            assert result == 25
-
+@pytest.mark.parametrize("handler_cls, kwargs, input_str, expected", [
+    pytest.param(IntegerInputHandler, {}, '123', 123, id="integer"),
+    pytest.param(IntegerInputHandler, {"negative_only": True}, '-5', -5, id="negative-integer"),
+    pytest.param(FloatInputHandler, {}, '3.14', 3.14, id="float"),
+    pytest.param(RangeNumberInputHandler, {"min_value": 1, "max_value": 100}, '50', 50, id="in-range"),
+    pytest.param(PercentageInputHandler, {}, '50', 50.0, id="percentage"),
+    pytest.param(PercentageInputHandler, {}, '75%', 75.0, id="percentage-with-sign"),
+    pytest.param(YearInputHandler, {}, '2023', 2023, id="year"),
+    pytest.param(AgeInputHandler, {}, '25', 25, id="age"),
+])
+def test_numeric_handler_roundtrip(patched_terminal, handler_cls, kwargs, input_str, expected):
+    handler = patched_terminal(handler_cls(prompt="Enter number", **kwargs), input_str)
+    assert handler.get() == expected
+
+
+@pytest.mark.parametrize("handler_cls, kwargs, input_str, exc", [
+    pytest.param(IntegerInputHandler, {"positive_only": True}, '-5', ValidationError, id="positive-integer"),
+    pytest.param(RangeNumberInputHandler, {"min_value": 1, "max_value": 100}, '150', ValidationError, id="out-of-range"),
+])
+def test_numeric_handler_raises(patched_terminal, handler_cls, kwargs, input_str, exc):
+    handler = patched_terminal(handler_cls(prompt="Enter number", **kwargs), input_str)
+    with pytest.raises(exc):
+        handler.get()
@@ -47,83 +47,81 @@ class TestOptionalValidator:
             validator.validate("invalid@username")
 
 
+@pytest.fixture(scope="module")
+def bool_validator():
+    return BooleanValidator()
+
+
+@pytest.fixture(scope="module")
+def yes_no_validator():
+    return YesNoValidator()
+
+
+@pytest.fixture(scope="module")
+def true_false_validator():
+    return TrueFalseValidator()
+
+
+@pytest.fixture(scope="module")
+def continue_validator():
+    return ContinueConfirmationValidator()
+
+
+@pytest.fixture(scope="module")
+def agreement_validator():
+    return AgreementValidator()
+
+
 class TestBooleanValidator:
-    def test_valid_boolean_strings(self):
-        validator = BooleanValidator()
-        assert validator.validate("yes") is True
-        assert validator.validate("no") is True
-        assert validator.validate("true") is True
-        assert validator.validate("false") is True
-        assert validator.validate("1") is True
-        assert validator.validate("0") is True
+    @pytest.mark.parametrize("tok", ["yes", "no", "true", "false", "1", "0"])
+    def test_valid_boolean_strings(self, bool_validator, tok):
+        assert bool_validator.validate(tok) is True
     
-    def test_python_bool(self):
-        validator = BooleanValidator()
-        assert validator.validate(True) is True
-        assert validator.validate(False) is True
+    @pytest.mark.parametrize("tok", [True, False])
+    def test_python_bool(self, bool_validator, tok):
+        assert bool_validator.validate(tok) is True
     
-    def test_invalid_boolean(self):
-        validator = BooleanValidator()
+    def test_invalid_boolean(self, bool_validator):
         with pytest.raises(ValidationError):
-            validator.validate("maybe")
+            bool_validator.validate("maybe")
 
 
 class TestYesNoValidator:
-    def test_valid_yes_no(self):
-        validator = YesNoValidator()
-        assert validator.validate("yes") is True
-        assert validator.validate("y") is True
-        assert validator.validate("no") is True
-        assert validator.validate("n") is True
+    @pytest.mark.parametrize("tok", ["yes", "y", "no", "n"])
+    def test_valid_yes_no(self, yes_no_validator, tok):
+        assert yes_no_validator.validate(tok) is True
     
-    def test_invalid_yes_no(self):
-        validator = YesNoValidator()
-        with pytest.raises(ValidationError):
-            validator.validate("true")
+    @pytest.mark.parametrize("tok", ["true", "1"])
+    def test_invalid_yes_no(self, yes_no_validator, tok):
         with pytest.raises(ValidationError):
-            validator.validate("1")
+            yes_no_validator.validate(tok)
 
 
 class TestTrueFalseValidator:
-    def test_valid_true_false(self):
-        validator = TrueFalseValidator()
-        assert validator.validate("true") is True
-        assert validator.validate("false") is True
-        assert validator.validate("t") is True
-        assert validator.validate("f") is True
-        assert validator.validate(True) is True
-        assert validator.validate(False) is True
+    @pytest.mark.parametrize("tok", ["true", "false", "t", "f", True, False])
+    def test_valid_true_false(self, true_false_validator, tok):
+        assert true_false_validator.validate(tok) is True
     
-    def test_invalid_true_false(self):
-        validator = TrueFalseValidator()
+    def test_invalid_true_false(self, true_false_validator):
         with pytest.raises(ValidationError):
-            validator.validate("yes")
+            true_false_validator.validate("yes")
 
 
 class TestContinueConfirmationValidator:
-    def test_valid_confirmations(self):
-        validator = ContinueConfirmationValidator()
-        assert validator.validate("continue") is True
-        assert validator.validate("proceed") is True
-        assert validator.validate("yes") is True
-        assert validator.validate("ok") is True
+    @pytest.mark.parametrize("tok", ["continue", "proceed", "yes", "ok"])
+    def test_valid_confirmations(self, continue_validator, tok):
+        assert continue_validator.validate(tok) is True
     
-    def test_invalid_confirmation(self):
-        validator = ContinueConfirmationValidator()
+    def test_invalid_confirmation(self, continue_validator):
         with pytest.raises(ValidationError):
-            validator.validate("cancel")
+            continue_validator.validate("cancel")
 
 
 class TestAgreementValidator:
-    def test_valid_agreements(self):
-        validator = AgreementValidator()
-        assert validator.validate("agree") is True
-        assert validator.validate("accept") is True
-        assert validator.validate("consent") is True
-        assert validator.validate("yes") is True
+    @pytest.mark.parametrize("tok", ["agree", "accept", "consent", "yes"])
+    def test_valid_agreements(self, agreement_validator, tok):
+        assert agreement_validator.validate(tok) is True
     
-    def test_invalid_agreement(self):
-        validator = AgreementValidator()
+    def test_invalid_agreement(self, agreement_validator):
         with pytest.raises(ValidationError):
-            validator.validate("disagree")
-
+            agreement_validator.validate("disagree")
@@ -10,7 +10,13 @@ from inputkit.validators.composite import (
     DateRangeValidator, SingleChoiceValidator, MultipleChoiceValidator,
     IndexedListValidator, EnumValidator, MultiFieldFormValidator
 )
-from inputkit.exceptions import ValidationError, RequiredValueError, MultiValidationError
+from inputkit.exceptions import ValidationError, RequiredValueError
+
+
+class Color(Enum):
+    RED = "red"
+    GREEN = "green"
+    BLUE = "blue"
 
 
 class TestCredentialsValidator:
@@ -47,118 +53,165 @@ class TestAddressValidator:
             validator.validate({"country": "USA"})
 
 
+@pytest.fixture(scope="module")
+def phone_validators():
+    """One PhoneNumberValidator per country, shared by the phone tests."""
+    return {
+        "IR": PhoneNumberValidator(country="IR"),
+        "US": PhoneNumberValidator(country="US"),
+        None: PhoneNumberValidator(),
+    }
+
+
 class TestPhoneNumberValidator:
-    def test_valid_phone_iran(self):
-        validator = PhoneNumberValidator(country="IR")
+    def test_valid_phone_iran(self, phone_validators):
+        validator = phone_validators["IR"]
         assert validator.validate("09121234567") is True
         assert validator.validate("+989121234567") is True
     
-    def test_valid_phone_us(self):
-        validator = PhoneNumberValidator(country="US")
-        assert validator.validate("+12025550123") is True
+    def test_valid_phone_us(self, phone_validators):
+        assert phone_validators["US"].validate("+12025550123") is True
     
-    def test_invalid_phone(self):
-        validator = PhoneNumberValidator()
+    def test_invalid_phone(self, phone_validators):
         with pytest.raises(ValidationError):
-            validator.validate("invalid")
+            phone_validators[None].validate("invalid")
 
 
 class TestDateRangeValidator:
-    def test_valid_date_range(self):
-        validator = DateRangeValidator()
+    def test_valid_date_range(self, make_validator):
+        validator = make_validator(DateRangeValidator)
         date_range = {
             "start_date": "2023-01-01",
             "end_date": "2023-12-31"
         }
         assert validator.validate(date_range) is True
     
-    def test_invalid_date_range(self):
-        validator = DateRangeValidator()
+    def test_invalid_date_range(self, make_validator):
+        validator = make_validator(DateRangeValidator)
         with pytest.raises(ValidationError):
             validator.validate({
                 "start_date": "2023-12-31",
                 "end_date": "2023-01-01"
             })
+    
+    def test_unpadded_fields_follow_strptime(self, make_validator):
+        validator = make_validator(DateRangeValidator)
+        assert validator.validate({"start_date": "2023-1-5", "end_date": "2023-12-31"}) is True
+    
+    @pytest.mark.parametrize("start", ["2023-02-30", "2023-13-01", "2023/01/01", "2023-01-01T00"])
+    def test_malformed_dates(self, make_validator, start):
+        validator = make_validator(DateRangeValidator)
+        with pytest.raises(ValidationError):
+            validator.validate({"start_date": start, "end_date": "2023-12-31"})
+    
+    def test_custom_format(self, make_validator):
+        validator = make_validator(DateRangeValidator, date_format="%d/%m/%Y")
+        assert validator.validate({"start_date": "01/01/2023", "end_date": "31/12/2023"}) is True
 
 
 class TestSingleChoiceValidator:
-    def test_valid_choice(self):
-        validator = SingleChoiceValidator(choices=["apple", "banana", "cherry"])
+    def test_valid_choice(self, make_validator):
+        validator = make_validator(SingleChoiceValidator, ("apple", "banana", "cherry"))
         assert validator.validate("apple") is True
     
-    def test_invalid_choice(self):
-        validator = SingleChoiceValidator(choices=["apple", "banana", "cherry"])
-        with pytest.raises(ValidationError):
+    def test_invalid_choice(self, make_validator):
+        validator = make_validator(SingleChoiceValidator, ("apple", "banana", "cherry"))
+        with pytest.raises(ValidationError) as exc_info:
+            validator.validate("orange")
+        assert str(exc_info.value) == "Value must be one of: apple, banana, cherry"
+    
+    def test_error_message_snapshots_choices(self):
+        choices = ["apple", "banana"]
+        validator = SingleChoiceValidator(choices)
+        with pytest.raises(ValidationError) as exc_info:
             validator.validate("orange")
+        choices.append("orange")
+        assert str(exc_info.value) == "Value must be one of: apple, banana"
     
-    def test_case_insensitive(self):
-        validator = SingleChoiceValidator(choices=["Apple", "Banana"], case_sensitive=False)
+    def test_case_insensitive(self, make_validator):
+        validator = make_validator(SingleChoiceValidator, ("Apple", "Banana"), case_sensitive=False)
         assert validator.validate("apple") is True
+    
+    def test_validate_many(self, make_validator):
+        validator = make_validator(SingleChoiceValidator, ("apple", "banana", "cherry"))
+        results = validator.validate_many(["apple", "orange", ["list"], "cherry"])
+        assert results[0] is True
+        assert isinstance(results[1], ValidationError)
+        assert isinstance(results[2], ValidationError)
+        assert results[3] is True
+    
+    def test_validate_many_case_insensitive(self, make_validator):
+        validator = make_validator(SingleChoiceValidator, ("Apple", "Banana"), case_sensitive=False)
+        results = validator.validate_many(["APPLE", "banana", "cherry"])
+        assert results[:2] == [True, True]
+        assert isinstance(results[2], ValidationError)
 
 
 class TestMultipleChoiceValidator:
-    def test_valid_choices(self):
-        validator = MultipleChoiceValidator(choices=["red", "green", "blue"])
+    def test_valid_choices(self, make_validator):
+        validator = make_validator(MultipleChoiceValidator, ("red", "green", "blue"))
         assert validator.validate(["red", "blue"]) is True
     
-    def test_too_few_selections(self):
-        validator = MultipleChoiceValidator(choices=["a", "b", "c"], min_selections=2)
+    def test_too_few_selections(self, make_validator):
+        validator = make_validator(MultipleChoiceValidator, ("a", "b", "c"), min_selections=2)
         with pytest.raises(ValidationError):
             validator.validate(["a"])
     
-    def test_too_many_selections(self):
-        validator = MultipleChoiceValidator(choices=["a", "b", "c"], max_selections=2)
+    def test_too_many_selections(self, make_validator):
+        validator = make_validator(MultipleChoiceValidator, ("a", "b", "c"), max_selections=2)
         with pytest.raises(ValidationError):
             validator.validate(["a", "b", "c"])
 
 
 class TestIndexedListValidator:
-    def test_valid_index(self):
-        validator = IndexedListValidator(max_index=5)
+    def test_valid_index(self, make_validator):
+        validator = make_validator(IndexedListValidator, max_index=5)
         assert validator.validate(0) is True
         assert validator.validate(4) is True
     
-    def test_invalid_index(self):
-        validator = IndexedListValidator(max_index=5)
+    def test_invalid_index(self, make_validator):
+        validator = make_validator(IndexedListValidator, max_index=5)
         with pytest.raises(ValidationError):
             validator.validate(5)
         with pytest.raises(ValidationError):
             validator.validate(-1)
+    
+    def test_validate_many(self, make_validator):
+        validator = make_validator(IndexedListValidator, max_index=5)
+        results = validator.validate_many([0, "4", 5, -1, "abc"])
+        assert results[:2] == [True, True]
+        assert all(isinstance(r, ValidationError) for r in results[2:])
 
 
 class TestEnumValidator:
-    def test_valid_enum(self):
-        class Color(Enum):
-            RED = "red"
-            GREEN = "green"
-            BLUE = "blue"
-        
-        validator = EnumValidator(Color)
+    def test_valid_enum(self, make_validator):
+        validator = make_validator(EnumValidator, Color)
         assert validator.validate(Color.RED) is True
         assert validator.validate("RED") is True
         assert validator.validate("red") is True
     
-    def test_invalid_enum(self):
-        class Color(Enum):
-            RED = "red"
-            GREEN = "green"
-        
-        validator = EnumValidator(Color)
+    def test_invalid_enum(self, make_validator):
+        validator = make_validator(EnumValidator, Color)
         with pytest.raises(ValidationError):
-            validator.validate("BLUE")
+            validator.validate("PURPLE")
+
+
+@pytest.fixture(scope="module")
+def form_field_validators(default_email_validator):
+    """Field validators shared by the form tests; they hold no per-call state."""
+    from inputkit.validators.strings import UsernameValidator
+    from inputkit.validators.numeric import AgeValidator
+    
+    return {
+        "username": UsernameValidator(),
+        "email": default_email_validator,
+        "age": AgeValidator()
+    }
 
 
 class TestMultiFieldFormValidator:
-    def test_valid_form(self):
-        from inputkit.validators.strings import UsernameValidator, EmailValidator
-        from inputkit.validators.numeric import AgeValidator
-        
-        validators = {
-            "username": UsernameValidator(),
-            "email": EmailValidator(),
-            "age": AgeValidator()
-        }
-        validator = MultiFieldFormValidator(field_validators=validators)
+    def test_valid_form(self, form_field_validators):
+        validator = MultiFieldFormValidator(field_validators=form_field_validators)
         
         form = {
             "username": "user123",
@@ -167,12 +220,11 @@ class TestMultiFieldFormValidator:
         }
         assert validator.validate(form) is True
     
-    def test_invalid_form(self):
-        from inputkit.validators.strings import UsernameValidator
+    def test_invalid_form(self, form_field_validators):
+        from inputkit.exceptions import MultiValidationError
         
-        validators = {"username": UsernameValidator()}
+        validators = {"username": form_field_validators["username"]}
         validator = MultiFieldFormValidator(field_validators=validators, require_all=True)
         
         with pytest.raises(MultiValidationError):
             validator.validate({"username": "invalid@username"})
-
@@ -3,6 +3,11 @@ Test suite for inputkit.validators.numeric module.
 
 Tests all numeric input validators with valid and invalid cases.
 """
+import pickle
+import re
+from decimal import Decimal
+from fractions import Fraction
+
 import pytest
 from inputkit.validators.numeric import (
     IntegerValidator, FloatValidator, RangeValidator, PercentageValidator,
@@ -11,114 +16,195 @@ from inputkit.validators.numeric import (
 from inputkit.exceptions import ValidationError, RangeError
 
 
+_RANGE_1_100 = {"min_value": 1, "max_value": 100}
+_RANGE_1_100_EXCLUSIVE = dict(_RANGE_1_100, min_inclusive=False, max_inclusive=False)
+_DECIMAL_PERCENT = re.compile(r"^\d+(\.\d+)?%?$")
+
+
+@pytest.fixture(scope="module")
+def default_integer_validator():
+    return IntegerValidator()
+
+
+@pytest.fixture(scope="module")
+def default_float_validator():
+    return FloatValidator()
+
+
+@pytest.fixture(scope="module")
+def default_percentage_validator():
+    return PercentageValidator()
+
+
+@pytest.fixture(scope="module")
+def default_year_validator():
+    return YearValidator()
+
+
+@pytest.fixture(scope="module")
+def default_age_validator():
+    return AgeValidator()
+
+
 class TestIntegerValidator:
-    def test_valid_integer(self):
-        validator = IntegerValidator()
-        assert validator.validate("123") is True
-        assert validator.validate(123) is True
-    
-    def test_positive_only(self):
-        validator = IntegerValidator(positive_only=True)
-        assert validator.validate("123") is True
-        with pytest.raises(RangeError):
-            validator.validate("-123")
+    def test_no_instance_dict(self):
+        assert not hasattr(IntegerValidator(), "__dict__")
     
-    def test_negative_only(self):
-        validator = IntegerValidator(negative_only=True)
-        assert validator.validate("-123") is True
-        with pytest.raises(RangeError):
-            validator.validate("123")
+    def test_valid_integer(self, default_integer_validator):
+        assert default_integer_validator.validate("123") is True
+        assert default_integer_validator.validate(123) is True
     
-    def test_invalid_integer(self):
-        validator = IntegerValidator()
-        with pytest.raises(ValidationError):
-            validator.validate("12.5")
+    @pytest.mark.parametrize("value", ["12.5", "abc", " 12", "1_000"])
+    def test_invalid_integer(self, default_integer_validator, value):
         with pytest.raises(ValidationError):
-            validator.validate("abc")
+            default_integer_validator.validate(value)
 
 
 class TestFloatValidator:
-    def test_valid_float(self):
-        validator = FloatValidator()
-        assert validator.validate("3.14") is True
-        assert validator.validate(3.14) is True
+    def test_valid_float(self, default_float_validator):
+        assert default_float_validator.validate("3.14") is True
+        assert default_float_validator.validate(3.14) is True
     
-    def test_positive_only(self):
-        validator = FloatValidator(positive_only=True)
-        assert validator.validate("3.14") is True
-        with pytest.raises(RangeError):
-            validator.validate("-3.14")
-    
-    def test_invalid_float(self):
-        validator = FloatValidator()
+    def test_invalid_float(self, default_float_validator):
         with pytest.raises(ValidationError):
-            validator.validate("abc")
+            default_float_validator.validate("abc")
 
 
 class TestRangeValidator:
-    def test_valid_range(self):
-        validator = RangeValidator(min_value=1, max_value=100)
-        assert validator.validate(50) is True
-        assert validator.validate("50") is True
+    def test_non_numeric_types(self, make_validator):
+        validator = make_validator(RangeValidator, **_RANGE_1_100)
+        assert validator.validate(Decimal("2.5")) is True
+        assert validator.validate(Fraction(1, 2) + 1) is True
+        with pytest.raises(ValidationError):
+            validator.validate(None)
+        with pytest.raises(ValidationError):
+            validator.validate([1])
+        with pytest.raises(ValidationError):
+            validator.validate(3j)
+        with pytest.raises(ValidationError):
+            make_validator(RangeValidator).validate(None)
     
-    def test_below_minimum(self):
-        validator = RangeValidator(min_value=1, max_value=100)
-        with pytest.raises(RangeError):
-            validator.validate(0)
+    @pytest.mark.parametrize("value", [Decimal("NaN"), Decimal("sNaN")])
+    def test_decimal_nan(self, make_validator, value):
+        validator = make_validator(RangeValidator, **_RANGE_1_100)
+        with pytest.raises(ValidationError):
+            validator.validate(value)
+        assert isinstance(validator.validate_many([value])[0], ValidationError)
     
-    def test_above_maximum(self):
-        validator = RangeValidator(min_value=1, max_value=100)
-        with pytest.raises(RangeError):
-            validator.validate(101)
+    def test_ambiguous_comparison(self, make_validator):
+        class ArrayLike:
+            # Elementwise comparison, like a numpy array: no single bool
+            def __ge__(self, other):
+                return self
+            __le__ = __ge__
+            
+            def __bool__(self):
+                raise ValueError("The truth value of an array is ambiguous")
+        
+        validator = make_validator(RangeValidator, **_RANGE_1_100)
+        with pytest.raises(ValidationError):
+            validator.validate(ArrayLike())
     
-    def test_exclusive_bounds(self):
-        validator = RangeValidator(min_value=1, max_value=100, min_inclusive=False, max_inclusive=False)
-        assert validator.validate(50) is True
-        with pytest.raises(RangeError):
-            validator.validate(1)
-        with pytest.raises(RangeError):
-            validator.validate(100)
+    def test_templated_error_repr_and_pickle(self, make_validator):
+        with pytest.raises(ValidationError) as excinfo:
+            make_validator(RangeValidator, **_RANGE_1_100).validate("abc")
+        error = excinfo.value
+        assert repr(error) == "ValidationError('Invalid numeric value: abc')"
+        copy = pickle.loads(pickle.dumps(error))
+        assert str(copy) == str(error) == "Invalid numeric value: abc"
+        assert copy.value == "abc"
+    
+    def test_validate_many(self, make_validator):
+        validator = make_validator(RangeValidator, **_RANGE_1_100, max_inclusive=False)
+        results = validator.validate_many([1, 50.5, "99", 100, "abc"])
+        assert results[:3] == [True, True, True]
+        assert isinstance(results[3], RangeError)
+        assert isinstance(results[4], ValidationError)
 
 
 class TestPercentageValidator:
-    def test_valid_percentage(self):
-        validator = PercentageValidator()
-        assert validator.validate("50") is True
-        assert validator.validate("50%") is True
-        assert validator.validate("100") is True
+    def test_valid_percentage(self, default_percentage_validator):
+        assert default_percentage_validator.validate("50") is True
+        assert default_percentage_validator.validate("50%") is True
+        assert default_percentage_validator.validate("100") is True
+    
+    @pytest.mark.parametrize("value", ["150", "abc"])
+    def test_invalid_percentage(self, default_percentage_validator, value):
+        with pytest.raises(ValidationError):
+            default_percentage_validator.validate(value)
     
-    def test_invalid_percentage(self):
-        validator = PercentageValidator()
+    def test_invalid_percentage_format(self, default_percentage_validator):
+        assert default_percentage_validator.validate("100.00%") is True
+        assert default_percentage_validator.validate("05.5") is True
         with pytest.raises(ValidationError):
-            validator.validate("150")
+            default_percentage_validator.validate("100.5%")
+        with pytest.raises(ValidationError):
+            default_percentage_validator.validate("1e1")
+    
+    def test_out_of_range_percentage(self, make_validator):
+        validator = make_validator(PercentageValidator, custom_pattern=_DECIMAL_PERCENT)
+        assert validator.validate("99.5%") is True
+        with pytest.raises(RangeError):
+            validator.validate("150%")
+    
+    @pytest.mark.parametrize("value", ["007", "0050", "0000000000100", "100.", "5."])
+    def test_syntax_matches_pattern(self, default_percentage_validator, value):
         with pytest.raises(ValidationError):
-            validator.validate("abc")
+            default_percentage_validator.validate(value)
 
 
 class TestYearValidator:
-    def test_valid_year(self):
-        validator = YearValidator()
-        assert validator.validate("2000") is True
-        assert validator.validate(2000) is True
+    def test_valid_year(self, default_year_validator):
+        assert default_year_validator.validate("2000") is True
+        assert default_year_validator.validate(2000) is True
     
-    def test_out_of_range(self):
-        validator = YearValidator(min_year=2000, max_year=2020)
-        with pytest.raises(RangeError):
-            validator.validate("1999")
-        with pytest.raises(RangeError):
-            validator.validate("2021")
+    @pytest.mark.parametrize("value", ["02024", "0000002024", "202"])
+    def test_not_four_digits(self, default_year_validator, value):
+        with pytest.raises(ValidationError):
+            default_year_validator.validate(value)
 
 
 class TestAgeValidator:
-    def test_valid_age(self):
-        validator = AgeValidator()
-        assert validator.validate("25") is True
-        assert validator.validate(25) is True
+    def test_valid_age(self, default_age_validator):
+        assert default_age_validator.validate("25") is True
+        assert default_age_validator.validate(25) is True
+        assert default_age_validator.validate("0") is True
     
-    def test_out_of_range(self):
-        validator = AgeValidator(min_age=18, max_age=65)
-        with pytest.raises(RangeError):
-            validator.validate("17")
-        with pytest.raises(RangeError):
-            validator.validate("66")
+    @pytest.mark.parametrize("value", ["007", "00"])
+    def test_leading_zero(self, default_age_validator, value):
+        with pytest.raises(ValidationError):
+            default_age_validator.validate(value)
+
+
+_CASES = [
+    (IntegerValidator, {"positive_only": True}, "123", None),
+    (IntegerValidator, {"positive_only": True}, "-123", RangeError),
+    (IntegerValidator, {"negative_only": True}, "-123", None),
+    (IntegerValidator, {"negative_only": True}, "123", RangeError),
+    (FloatValidator, {"positive_only": True}, "3.14", None),
+    (FloatValidator, {"positive_only": True}, "-3.14", RangeError),
+    (RangeValidator, _RANGE_1_100, 50, None),
+    (RangeValidator, _RANGE_1_100, "50", None),
+    (RangeValidator, _RANGE_1_100, 0, RangeError),
+    (RangeValidator, _RANGE_1_100, 101, RangeError),
+    (RangeValidator, _RANGE_1_100_EXCLUSIVE, 50, None),
+    (RangeValidator, _RANGE_1_100_EXCLUSIVE, 1, RangeError),
+    (RangeValidator, _RANGE_1_100_EXCLUSIVE, 100, RangeError),
+    (YearValidator, {"min_year": 2000, "max_year": 2020}, "1999", RangeError),
+    (YearValidator, {"min_year": 2000, "max_year": 2020}, "2021", RangeError),
+    (YearValidator, {"min_year": 1800, "max_year": 2200}, "1850", None),
+    (YearValidator, {"min_year": 1800, "max_year": 2200}, 2150, None),
+    (YearValidator, {"min_year": 1800, "max_year": 2200}, "20x0", ValidationError),
+    (AgeValidator, {"min_age": 18, "max_age": 65}, "17", RangeError),
+    (AgeValidator, {"min_age": 18, "max_age": 65}, "66", RangeError),
+]
+
 
+@pytest.mark.parametrize("validator_cls,kwargs,value,exc", _CASES)
+def test_validator_table(make_validator, validator_cls, kwargs, value, exc):
+    validator = make_validator(validator_cls, **kwargs)
+    if exc is None:
+        assert validator.validate(value) is True
+    else:
+        with pytest.raises(exc):
+            validator.validate(value)
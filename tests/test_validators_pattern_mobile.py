@@ -0,0 +1,30 @@
+"""
+Test suite for inputkit.validators.patterns module.
+
+Covers the mobile pattern classes: MobileNumberPattern.
+"""
+import pytest
+from inputkit.validators.patterns import MobileNumberPattern
+
+class TestMobileNumberPattern:
+    @pytest.mark.parametrize("num,country,expected", [
+        ("+989121234567", None, True),
+        ("989121234567", None, False),
+        ("09121234567", "IR", True),
+        ("+989121234567", "IR", True),
+        ("08121234567", "IR", False),
+        ("+12025550123", "US", True),
+        ("2025550123", "IR", False),
+        ("+447911123456", "UK", True),
+        ("071234", "UK", False),
+    ])
+    def test_mobile(self, num, country, expected):
+        kwargs = {"country": country} if country else {}
+        assert MobileNumberPattern.is_valid(num, **kwargs) is expected
+    @pytest.mark.parametrize("number", [
+        "09121234567", "+989121234567", "9121234567", "0912123456", "+98912123456789",
+        "+1234567890", "+1234567890123456", "+١٢٣٤٥٦٧٨٩٠١", "",
+    ])
+    def test_explicit_checks_match_regex(self, number):
+        assert MobileNumberPattern.is_valid_ir(number) == bool(MobileNumberPattern.IR_09X.fullmatch(number))
+        assert MobileNumberPattern.is_valid_e164(number) == bool(MobileNumberPattern.E164.fullmatch(number))
@@ -0,0 +1,66 @@
+"""
+Test suite for inputkit.validators.patterns module.
+
+Covers the numeric pattern classes: IntegerPattern, FloatPattern, PercentagePattern, NumericPattern, YearPattern, AgePattern.
+"""
+import pytest
+from inputkit.validators.patterns import (
+    IntegerPattern, FloatPattern, PercentagePattern, NumericPattern, YearPattern, AgePattern
+)
+
+class TestIntegerPattern:
+    @pytest.mark.parametrize("text,expect", [
+        ("123", True), ("-42", True), ("+0", True), ("1.25", False), ("١٢٣", False)
+    ])
+    def test_int(self, text, expect):
+        assert IntegerPattern.is_valid(text) == expect
+    def test_positive(self):
+        assert IntegerPattern.is_positive("123")
+        assert not IntegerPattern.is_positive("-1")
+        assert not IntegerPattern.is_positive("0")
+    def test_negative(self):
+        assert IntegerPattern.is_negative("-33")
+        assert not IntegerPattern.is_negative("77")
+        assert not IntegerPattern.is_negative("-0")
+
+class TestFloatPattern:
+    @pytest.mark.parametrize("text,expect", [
+        ("3.14", True), ("-0.001", True), ("2.", True), ("5", False)
+    ])
+    def test_float(self, text, expect):
+        assert FloatPattern.is_valid(text) == expect
+    def test_positive(self):
+        assert FloatPattern.is_positive("1.23")
+        assert not FloatPattern.is_positive("-1.23")
+    def test_negative(self):
+        assert FloatPattern.is_negative("-4.5")
+        assert not FloatPattern.is_negative("9.5")
+
+class TestPercentagePattern:
+    @pytest.mark.parametrize("text,expect", [
+        ("100", True), ("100%", True), ("45.5%", True), ("123", False)
+    ])
+    def test_pct(self, text, expect):
+        assert PercentagePattern.is_valid(text) == expect
+
+class TestNumericPattern:
+    @pytest.mark.parametrize("text,expect", [
+        ("123", "int"), ("-42", "int"), ("3.14", "float"), (".5", "float"),
+        ("45.5%", "pct"), ("100%", "pct"), ("150%", None), ("abc", None), ("", None)
+    ])
+    def test_classify(self, text, expect):
+        assert NumericPattern.classify(text) == expect
+
+class TestYearPattern:
+    def test_valid_year(self):
+        assert YearPattern.is_valid("2000")
+        assert YearPattern.is_valid("1999")
+        assert not YearPattern.is_valid("1899")
+        assert not YearPattern.is_valid("2100")
+
+class TestAgePattern:
+    @pytest.mark.parametrize("age,expect", [
+        ("0", True), ("21", True), ("99", True), ("150", True), ("151", False), ("-1", False)
+    ])
+    def test_age(self, age, expect):
+        assert AgePattern.is_valid(age) == expect
@@ -0,0 +1,53 @@
+"""
+Test suite for inputkit.validators.patterns module.
+
+Covers the security and confirmation pattern classes: PinPattern, ApiKeyPattern, TokenPattern, BooleanPattern.
+"""
+import pytest
+from inputkit.validators.patterns import (
+    PinPattern, ApiKeyPattern, TokenPattern, BooleanPattern
+)
+
+_TRUTHY = frozenset({"yes", "y", "true", "t", "on", "1"})
+_FALSY = frozenset({"no", "n", "false", "f", "off", "0"})
+# Sorted so every collection sees the same order regardless of hash seed
+_BOOL_CASES = sorted({
+    **{t: True for t in _TRUTHY},
+    **{f: True for f in _FALSY},
+    "Y": True, "TrUe": True, "sure": True, "maybe": False,
+}.items())
+
+class TestPinPattern:
+    def test_pins(self):
+        assert PinPattern.is_valid("1234")
+        assert PinPattern.is_valid("123456789012")
+        assert not PinPattern.is_valid("123")
+        assert not PinPattern.is_valid("notapin")
+        assert not PinPattern.is_valid("١٢٣٤")
+        assert not PinPattern.is_valid("1234\n")
+
+class TestApiKeyPattern:
+    def test_api_keys(self):
+        assert ApiKeyPattern.is_valid("a" * 32)
+        assert ApiKeyPattern.is_valid("api_KEY-1234567890abcdefABCDEF_09876")
+        assert not ApiKeyPattern.is_valid("short")
+        assert not ApiKeyPattern.is_valid("!@#$%^&*")
+        assert not ApiKeyPattern.is_valid("a" * 31 + "!")
+        assert not ApiKeyPattern.is_valid("a" * 31 + "é")
+        assert not ApiKeyPattern.is_valid("a" * 129)
+
+class TestTokenPattern:
+    def test_tokens(self):
+        assert TokenPattern.is_valid("eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9")
+        assert TokenPattern.is_valid("deadbeef1234==")
+        assert not TokenPattern.is_valid(" ")
+        assert not TokenPattern.is_valid("token!")
+
+class TestBooleanPattern:
+    @pytest.mark.parametrize("text,expect", _BOOL_CASES, ids=[text for text, _ in _BOOL_CASES])
+    def test_bool_variants(self, text, expect):
+        assert BooleanPattern.is_valid(text) == expect
+
+    def test_values_match_pattern(self):
+        for token in BooleanPattern.VALUES:
+            assert BooleanPattern.PATTERN.fullmatch(token)
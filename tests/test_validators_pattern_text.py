@@ -0,0 +1,77 @@
+"""
+Test suite for inputkit.validators.patterns module.
+
+Covers the text pattern classes: UsernamePattern, FullNamePattern, EmailPattern, URLPattern, FilePathPattern, CommandPattern, MultiLineTextPattern.
+"""
+import pytest
+from inputkit.validators.patterns import (
+    UsernamePattern, FullNamePattern, EmailPattern, URLPattern, FilePathPattern, CommandPattern,
+    MultiLineTextPattern
+)
+
+class TestUsernamePattern:
+    def test_strict_valid(self):
+        assert UsernamePattern.is_valid("user_name-123")
+    def test_strict_invalid(self):
+        assert not UsernamePattern.is_valid("user@name")
+    def test_relaxed_valid(self):
+        assert UsernamePattern.is_valid("نام_کاربری123", strict=False)
+
+class TestFullNamePattern:
+    def test_basic(self):
+        assert FullNamePattern.is_valid("Ali Reza")
+        assert FullNamePattern.is_valid("René Descartes")
+        assert FullNamePattern.is_valid("Mary-Jane O'Neil")
+    def test_invalid(self):
+        assert not FullNamePattern.is_valid("A ")
+        assert not FullNamePattern.is_valid("123$@")
+
+class TestEmailPattern:
+    @pytest.mark.parametrize("email,expect", [
+        ("user.name@domain.co.uk", True),
+        ("bad_email@", False), ("user@sub.domain.co.uk", True),
+        ("user@domain", False), ("\u017fam@example.com", False),
+        ("@domain.com", False)
+    ])
+    def test_various(self, email, expect):
+        assert EmailPattern.is_valid(email) == expect
+
+class TestURLPattern:
+    @pytest.mark.parametrize("url,expect", [
+        ("ftp://host.name/file.txt", True),
+        ("file:///c:/windows/path", True),
+        ("not//valid", False)
+    ])
+    def test_urls(self, url, expect):
+        assert URLPattern.is_valid(url) == expect
+
+class TestFilePathPattern:
+    def test_unix(self):
+        assert FilePathPattern.is_valid("/usr/local/bin/file.sh")
+    def test_windows(self):
+        assert FilePathPattern.is_valid(r"C:\Users\user\Desktop\file.txt")
+    def test_invalid(self):
+        assert not FilePathPattern.is_valid("$home/bin/file.txt")
+
+class TestCommandPattern:
+    def test_basic(self):
+        assert CommandPattern.is_valid("ls -la /tmp")
+        assert not CommandPattern.is_valid("echo Hello | grep x; rm -rf /") # semi-invalid
+
+class TestMultiLineTextPattern:
+    def test_multiline(self):
+        assert MultiLineTextPattern.is_valid("first\nsecond line")
+        assert not MultiLineTextPattern.is_valid("one line only")
+
+class TestLongHostileInputs:
+    """Inputs shaped to trigger backtracking; each must fail without stalling."""
+    @pytest.mark.parametrize("pattern_cls,text", [
+        (EmailPattern, "a@" + "a-" * 5000 + "!"),
+        (EmailPattern, "a" * 10000 + "@"),
+        (URLPattern, "http://a" + ".a" * 5000 + " "),
+        (FilePathPattern, "C:\\" + "a." * 5000 + "\x00"),
+        (FilePathPattern, "/" + "a/" * 5000 + " "),
+        (CommandPattern, "a " * 5000 + "\n"),
+    ])
+    def test_rejected(self, pattern_cls, text):
+        assert not pattern_cls.is_valid(text)
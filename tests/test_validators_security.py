@@ -11,112 +11,134 @@ from inputkit.validators.security import (
 from inputkit.exceptions import PasswordStrengthError, ValidationError, LengthError
 
 
+_API_KEY_VALID = "a" * 32
+_API_KEY_LONG = "a" * 100
+_SECRET_LONG = "a" * 25
+_SPECIAL_ONLY = {
+    "min_length": 1, "require_uppercase": False,
+    "require_lowercase": False, "require_digit": False,
+}
+
+
+@pytest.fixture(scope="module")
+def default_pin_validator():
+    return PinValidator()
+
+
+@pytest.fixture(scope="module")
+def default_api_key_validator():
+    return ApiKeyValidator()
+
+
+@pytest.fixture(scope="module")
+def default_token_validator():
+    return TokenValidator()
+
+
+@pytest.fixture(scope="module")
+def default_secret_text_validator():
+    return SecretTextValidator()
+
+
 class TestPasswordValidator:
-    def test_strong_password(self):
-        validator = PasswordValidator()
-        assert validator.validate("Password123!") is True
+    def test_strong_password(self, default_password_validator):
+        assert default_password_validator.validate("Password123!") is True
     
-    def test_weak_password_too_short(self):
-        validator = PasswordValidator(min_length=8)
+    def test_weak_password_no_uppercase(self, default_password_validator):
         with pytest.raises(PasswordStrengthError):
-            validator.validate("Pass1!")
+            default_password_validator.validate("password123!")
     
-    def test_weak_password_no_uppercase(self):
-        validator = PasswordValidator()
+    def test_weak_password_no_lowercase(self, default_password_validator):
         with pytest.raises(PasswordStrengthError):
-            validator.validate("password123!")
+            default_password_validator.validate("PASSWORD123!")
     
-    def test_weak_password_no_lowercase(self):
-        validator = PasswordValidator()
+    def test_weak_password_no_digit(self, default_password_validator):
         with pytest.raises(PasswordStrengthError):
-            validator.validate("PASSWORD123!")
+            default_password_validator.validate("Password!")
     
-    def test_weak_password_no_digit(self):
-        validator = PasswordValidator()
+    def test_weak_password_no_special(self, default_password_validator):
         with pytest.raises(PasswordStrengthError):
-            validator.validate("Password!")
+            default_password_validator.validate("Password123")
     
-    def test_weak_password_no_special(self):
-        validator = PasswordValidator()
+    def test_non_ascii_digit_counts_as_digit(self, default_password_validator):
+        assert default_password_validator.validate("Password١!") is True
+    
+    @pytest.mark.parametrize("special", list('!@#$%^&*(),.?":{}|<>'))
+    def test_each_special_character(self, make_validator, special):
+        validator = make_validator(PasswordValidator, **_SPECIAL_ONLY)
+        assert validator.validate("a" + special) is True
+    
+    def test_other_punctuation_is_not_special(self, make_validator):
+        validator = make_validator(PasswordValidator, **_SPECIAL_ONLY)
         with pytest.raises(PasswordStrengthError):
-            validator.validate("Password123")
+            validator.validate("a-_~")
+    
+    def test_collect_all_reasons(self, default_password_validator):
+        with pytest.raises(PasswordStrengthError) as exc_info:
+            default_password_validator.validate("abc")
+        assert len(exc_info.value.context["reasons"]) == 4
     
-    def test_custom_requirements(self):
-        validator = PasswordValidator(
-            min_length=12,
-            require_uppercase=False,
-            require_special=False
-        )
-        assert validator.validate("password1234") is True
+    def test_first_reason_only(self, make_validator):
+        validator = make_validator(PasswordValidator, collect_all_reasons=False)
+        with pytest.raises(PasswordStrengthError) as exc_info:
+            validator.validate("abc")
+        assert exc_info.value.context["reasons"] == ["Password must be at least 8 characters long"]
+        with pytest.raises(PasswordStrengthError) as exc_info:
+            validator.validate("abcdefgh")
+        assert exc_info.value.context["reasons"] == ["Password must contain at least one uppercase letter"]
 
 
 class TestPinValidator:
-    def test_valid_pin(self):
-        validator = PinValidator()
-        assert validator.validate("1234") is True
-        assert validator.validate("123456789012") is True
-    
-    def test_pin_too_short(self):
-        validator = PinValidator(min_length=4)
-        with pytest.raises(ValidationError):
-            validator.validate("123")
+    def test_valid_pin(self, default_pin_validator):
+        assert default_pin_validator.validate("1234") is True
+        assert default_pin_validator.validate("123456789012") is True
     
-    def test_pin_too_long(self):
-        validator = PinValidator(max_length=6)
+    def test_invalid_pin_format(self, default_pin_validator):
         with pytest.raises(ValidationError):
-            validator.validate("1234567")
+            default_pin_validator.validate("abc")
     
-    def test_invalid_pin_format(self):
-        validator = PinValidator()
-        with pytest.raises(ValidationError):
-            validator.validate("abc")
+    def test_pattern_shared_for_same_bounds(self):
+        assert PinValidator(4, 6).pattern is PinValidator(4, 6).pattern
 
 
 class TestApiKeyValidator:
-    def test_valid_api_key(self):
-        validator = ApiKeyValidator()
-        key = "a" * 32
-        assert validator.validate(key) is True
-    
-    def test_api_key_too_short(self):
-        validator = ApiKeyValidator(min_length=32)
-        with pytest.raises(LengthError):
-            validator.validate("short")
-    
-    def test_api_key_too_long(self):
-        validator = ApiKeyValidator(max_length=64)
-        key = "a" * 100
-        with pytest.raises(LengthError):
-            validator.validate(key)
+    def test_valid_api_key(self, default_api_key_validator):
+        assert default_api_key_validator.validate(_API_KEY_VALID) is True
 
 
 class TestTokenValidator:
-    def test_valid_token(self):
-        validator = TokenValidator()
-        assert validator.validate("eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9") is True
-        assert validator.validate("deadbeef1234==") is True
+    def test_valid_token(self, default_token_validator):
+        assert default_token_validator.validate("eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9") is True
+        assert default_token_validator.validate("deadbeef1234==") is True
     
-    def test_invalid_token(self):
-        validator = TokenValidator()
+    @pytest.mark.parametrize("value", ["token with spaces", "token!"])
+    def test_invalid_token(self, default_token_validator, value):
         with pytest.raises(ValidationError):
-            validator.validate("token with spaces")
-        with pytest.raises(ValidationError):
-            validator.validate("token!")
+            default_token_validator.validate(value)
 
 
 class TestSecretTextValidator:
-    def test_valid_secret(self):
-        validator = SecretTextValidator()
-        assert validator.validate("secret123") is True
-    
-    def test_secret_too_short(self):
-        validator = SecretTextValidator(min_length=10)
-        with pytest.raises(LengthError):
-            validator.validate("short")
-    
-    def test_secret_too_long(self):
-        validator = SecretTextValidator(max_length=20)
-        secret = "a" * 25
-        with pytest.raises(LengthError):
-            validator.validate(secret)
+    def test_valid_secret(self, default_secret_text_validator):
+        assert default_secret_text_validator.validate("secret123") is True
+
+
+_CASES = [
+    (PasswordValidator, {"min_length": 8}, "Pass1!", PasswordStrengthError),
+    (PasswordValidator, {"min_length": 12, "require_uppercase": False, "require_special": False}, "password1234", None),
+    (PinValidator, {"min_length": 4}, "123", ValidationError),
+    (PinValidator, {"max_length": 6}, "1234567", ValidationError),
+    (ApiKeyValidator, {"min_length": 32}, "short", LengthError),
+    (ApiKeyValidator, {"max_length": 64}, _API_KEY_LONG, LengthError),
+    (SecretTextValidator, {"min_length": 10}, "short", LengthError),
+    (SecretTextValidator, {"max_length": 20}, _SECRET_LONG, LengthError),
+]
+
 
+@pytest.mark.parametrize("validator_cls,kwargs,value,exc", _CASES)
+def test_validator_table(make_validator, validator_cls, kwargs, value, exc):
+    validator = make_validator(validator_cls, **kwargs)
+    if exc is None:
+        assert validator.validate(value) is True
+    else:
+        with pytest.raises(exc):
+            validator.validate(value)
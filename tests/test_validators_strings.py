@@ -6,17 +6,54 @@ Tests all textual input validators with valid and invalid cases.
 import pytest
 import re
 from inputkit.validators.strings import (
-    PlainTextValidator, UsernameValidator, FullNameValidator, EmailValidator,
-    URLValidator, FilePathValidator, CommandValidator, MultiLineTextValidator,
-    SlugValidator
+    PlainTextValidator, UsernameValidator, FullNameValidator, FilePathValidator,
+    CommandValidator, MultiLineTextValidator, SlugValidator
 )
 from inputkit.exceptions import ValidationError, LengthError, PatternMismatchError
 
 
+_UPPER_ONLY = re.compile(r"^[A-Z]+$")
+_LOWER_3_10 = re.compile(r"^[a-z]{3,10}$")
+
+
+@pytest.fixture(scope="module")
+def upper_text_validator():
+    return PlainTextValidator(custom_pattern=_UPPER_ONLY)
+
+
+@pytest.fixture(scope="module")
+def default_plain_text_validator():
+    return PlainTextValidator()
+
+
+@pytest.fixture(scope="module")
+def default_full_name_validator():
+    return FullNameValidator()
+
+
+@pytest.fixture(scope="module")
+def default_file_path_validator():
+    return FilePathValidator()
+
+
+@pytest.fixture(scope="module")
+def default_command_validator():
+    return CommandValidator()
+
+
+@pytest.fixture(scope="module")
+def default_multi_line_text_validator():
+    return MultiLineTextValidator()
+
+
+@pytest.fixture(scope="module")
+def default_slug_validator():
+    return SlugValidator()
+
+
 class TestPlainTextValidator:
-    def test_valid_text(self):
-        validator = PlainTextValidator()
-        assert validator.validate("Hello World") is True
+    def test_valid_text(self, default_plain_text_validator):
+        assert default_plain_text_validator.validate("Hello World") is True
     
     def test_min_length(self):
         validator = PlainTextValidator(min_length=5)
@@ -30,14 +67,22 @@ class TestPlainTextValidator:
         with pytest.raises(LengthError):
             validator.validate("This is too long")
     
-    def test_empty_text(self):
-        validator = PlainTextValidator()
+    def test_empty_text(self, default_plain_text_validator):
         with pytest.raises(ValidationError):
-            validator.validate("")
+            default_plain_text_validator.validate("")
     
-    def test_custom_pattern(self):
-        pattern = re.compile(r"^[A-Z]+$")
-        validator = PlainTextValidator(custom_pattern=pattern)
+    @pytest.mark.parametrize("text,valid", [("HELLO", True), ("WORLD", True), ("hello", False)])
+    def test_custom_pattern(self, upper_text_validator, text, valid):
+        if valid:
+            assert upper_text_validator.validate(text) is True
+        else:
+            with pytest.raises(PatternMismatchError):
+                upper_text_validator.validate(text)
+    
+    def test_custom_pattern_string(self):
+        validator = PlainTextValidator(custom_pattern=r"^[A-Z]+$")
+        other = PlainTextValidator(custom_pattern=r"^[A-Z]+$")
+        assert validator.custom_pattern is other.custom_pattern
         assert validator.validate("HELLO") is True
         with pytest.raises(PatternMismatchError):
             validator.validate("hello")
@@ -58,95 +103,91 @@ class TestUsernameValidator:
         assert validator.validate("user_name-123") is True
     
     def test_custom_pattern(self):
-        pattern = re.compile(r"^[a-z]{3,10}$")
-        validator = UsernameValidator(custom_pattern=pattern)
+        validator = UsernameValidator(custom_pattern=_LOWER_3_10)
         assert validator.validate("username") is True
         with pytest.raises(PatternMismatchError):
             validator.validate("USERNAME")
 
 
 class TestFullNameValidator:
-    def test_valid_name(self):
-        validator = FullNameValidator()
-        assert validator.validate("John Doe") is True
-        assert validator.validate("Mary-Jane O'Neil") is True
+    def test_valid_name(self, default_full_name_validator):
+        assert default_full_name_validator.validate("John Doe") is True
+        assert default_full_name_validator.validate("Mary-Jane O'Neil") is True
     
-    def test_invalid_name(self):
-        validator = FullNameValidator()
+    @pytest.mark.parametrize("value", ["123", "A"])
+    def test_invalid_name(self, default_full_name_validator, value):
         with pytest.raises(PatternMismatchError):
-            validator.validate("123")
-        with pytest.raises(PatternMismatchError):
-            validator.validate("A")
+            default_full_name_validator.validate(value)
 
 
 class TestEmailValidator:
-    def test_valid_email(self):
-        validator = EmailValidator()
-        assert validator.validate("test@example.com") is True
-        assert validator.validate("user.name@domain.co.uk") is True
+    def test_valid_email(self, default_email_validator):
+        assert default_email_validator.validate("test@example.com") is True
     
-    def test_invalid_email(self):
-        validator = EmailValidator()
-        with pytest.raises(PatternMismatchError):
-            validator.validate("invalid-email")
+    def test_invalid_email(self, default_email_validator):
         with pytest.raises(PatternMismatchError):
-            validator.validate("@domain.com")
+            default_email_validator.validate("invalid-email")
+    
+    def test_validate_many(self, default_email_validator):
+        results = default_email_validator.validate_many(["test@example.com", "invalid-email", 42])
+        assert results[0] is True
+        assert isinstance(results[1], PatternMismatchError)
+        assert isinstance(results[2], ValidationError)
 
 
 class TestURLValidator:
-    def test_valid_url(self):
-        validator = URLValidator()
-        assert validator.validate("https://example.com") is True
-        assert validator.validate("ftp://host.name/file.txt") is True
+    def test_valid_url(self, default_url_validator):
+        assert default_url_validator.validate("https://example.com") is True
     
-    def test_invalid_url(self):
-        validator = URLValidator()
+    def test_invalid_url(self, default_url_validator):
         with pytest.raises(PatternMismatchError):
-            validator.validate("not-a-url")
+            default_url_validator.validate("not-a-url")
 
 
 class TestFilePathValidator:
-    def test_unix_path(self):
-        validator = FilePathValidator()
-        assert validator.validate("/usr/local/bin/file.sh") is True
+    def test_unix_path(self, default_file_path_validator):
+        assert default_file_path_validator.validate("/usr/local/bin/file.sh") is True
     
-    def test_windows_path(self):
-        validator = FilePathValidator()
-        assert validator.validate(r"C:\\Users\\file.txt") is True
+    def test_windows_path(self, default_file_path_validator):
+        assert default_file_path_validator.validate(r"C:\Users\file.txt") is True
 
 
 class TestCommandValidator:
-    def test_valid_command(self):
-        validator = CommandValidator()
-        assert validator.validate("ls -la /tmp") is True
+    def test_valid_command(self, default_command_validator):
+        assert default_command_validator.validate("ls -la /tmp") is True
     
-    def test_invalid_command(self):
-        validator = CommandValidator()
+    def test_invalid_command(self, default_command_validator):
         # Commands with dangerous chars might fail
         with pytest.raises(PatternMismatchError):
-            validator.validate("rm -rf /")
+            default_command_validator.validate("rm -rf /")
 
 
 class TestMultiLineTextValidator:
-    def test_valid_multiline(self):
-        validator = MultiLineTextValidator()
-        assert validator.validate("line1\nline2") is True
+    def test_valid_multiline(self, default_multi_line_text_validator):
+        assert default_multi_line_text_validator.validate("line1\nline2") is True
     
-    def test_single_line(self):
-        validator = MultiLineTextValidator()
+    def test_single_line(self, default_multi_line_text_validator):
         with pytest.raises(ValidationError):
-            validator.validate("single line")
+            default_multi_line_text_validator.validate("single line")
+    
+    def test_min_lines_with_wide_characters(self):
+        validator = MultiLineTextValidator(min_lines=3)
+        assert validator.validate("é€\n😀\nline") is True
+        with pytest.raises(ValidationError):
+            validator.validate("é€\n😀")
 
 
 class TestSlugValidator:
-    def test_valid_slug(self):
-        validator = SlugValidator()
-        assert validator.validate("my-slug-123") is True
+    def test_valid_slug(self, default_slug_validator):
+        assert default_slug_validator.validate("my-slug-123") is True
     
-    def test_invalid_slug(self):
-        validator = SlugValidator()
-        with pytest.raises(PatternMismatchError):
-            validator.validate("My Slug")  # uppercase and space
+    @pytest.mark.parametrize("value", [
+        "My Slug",  # uppercase and space
+        "slug_123",  # underscore
+        "ab",  # too short
+        "a" * 65,  # too long
+    ], ids=["upper-space", "underscore", "too-short", "too-long"])
+    def test_invalid_slug(self, default_slug_validator, value):
         with pytest.raises(PatternMismatchError):
-            validator.validate("slug_123")  # underscore
+            default_slug_validator.validate(value)
 